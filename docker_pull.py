@@ -31,21 +31,28 @@ Licensed under the MIT License - see LICENSE file for details
 """
 
 import argparse
-import gzip
+import concurrent.futures
+import functools
+import hashlib
+import http.client
+import io
 import json
 import logging
+import mmap
 import os
 import re
 import shutil
-import signal
 import socket
 import ssl
 import sys
 import tarfile
 import tempfile
+import threading
 import time
 import traceback
 import urllib.request
+import warnings
+import zlib
 from datetime import datetime, timezone
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, urlparse
@@ -55,12 +62,83 @@ from urllib.request import (
     Request,
     build_opener,
     install_opener,
-    urlopen,
 )
 
+# Optional ISA-L accelerated inflate, used only with --fast-decompress.
+# The standard library zlib remains the default so no dependency is required.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# Optional zstd decoder for layers pushed as tar+zstd. Without it such
+# layers are stored compressed, which recent Docker versions still load.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Credential masking patterns for URLs embedded in text
+_CRED_PATTERNS = (
+    re.compile(r"://[^:/@]+:[^@]+@"),  # ://user:pass@
+    re.compile(r"://[^:/@]+@"),  # ://user@
+)
+_CRED_REPL = "://***:***@"
+
+# Blobs with a known size below this are buffered in memory, not on disk
+_SMALL_BLOB_LIMIT = 1024 * 1024
+
+# Blobs at least this large are fetched as parallel byte ranges when the
+# server supports it; one TCP stream rarely saturates a CDN link
+_RANGE_THRESHOLD = 64 * 1024 * 1024
+_RANGE_PART_SIZE = 32 * 1024 * 1024
+_RANGE_WORKERS = 8
+
+# A single-stream blob download cut off mid-transfer is resumed with a
+# Range request from the last byte received, at most this many times
+_RESUME_ATTEMPTS = 3
+
+# Reassembled range downloads are hashed from an mmap in windows this large
+_HASH_WINDOW = 64 * 1024 * 1024
+
+# Tar members at least this large are copied with os.sendfile where available
+_SENDFILE_THRESHOLD = 1024 * 1024
+
+# Unread bodies up to this size (HEAD, redirects, error pages) are drained
+# when their response is closed, so the connection can go back to the pool
+_DRAIN_LIMIT = 64 * 1024
+
+# Transient gateway errors are retried with exponential backoff
+_RETRY_STATUSES = frozenset((502, 503, 504))
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.3
+
+# Accept headers, built once rather than per request
+_MANIFEST_LIST_ACCEPT = (
+    "application/vnd.docker.distribution.manifest.list.v2+json,"
+    "application/vnd.docker.distribution.manifest.v2+json,"
+    "application/vnd.oci.image.index.v1+json,"
+    "application/vnd.oci.image.manifest.v1+json"
+)
+_MANIFEST_ACCEPT = (
+    "application/vnd.docker.distribution.manifest.v2+json,"
+    "application/vnd.oci.image.manifest.v1+json"
+)
+_BLOB_ACCEPT = (
+    "application/vnd.docker.image.rootfs.diff.tar.gzip,application/octet-stream,*/*"
+)
+
+# A progress line is redrawn at most every _PROGRESS_INTERVAL seconds, and
+# the clock is only read once _PROGRESS_MIN_BYTES arrived since the last draw
+_PROGRESS_INTERVAL = 0.1
+_PROGRESS_MIN_BYTES = 256 * 1024
+
+# Units for human readable sizes, indexed by power of 1024
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -93,16 +171,196 @@ def setup_logging(level=logging.INFO, debug=False):
         logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def _compile_no_proxy(no_proxy_list):
+    """Pre-split no_proxy entries into structures for fast matching.
+
+    Args:
+        no_proxy_list (list): Host entries from NO_PROXY / --no-proxy
+
+    Returns:
+        tuple: (wildcard, exact_hosts, suffixes) where wildcard is True if
+            "*" is present, exact_hosts is a frozenset of the entries that
+            name a host and suffixes is a tuple of ".domain" suffixes
+    """
+    wildcard = "*" in no_proxy_list
+    # ".corp.com" only matches subdomains, so it never needs an exact lookup
+    exact_hosts = frozenset(host for host in no_proxy_list if not host.startswith("."))
+    suffixes = tuple(
+        host if host.startswith(".") else "." + host for host in no_proxy_list
+    )
+    return wildcard, exact_hosts, suffixes
+
+
+@functools.lru_cache(maxsize=64)
+def _bypass(hostname, no_proxy_rules):
+    """Check hostname against compiled no_proxy rules (memoized per host).
+
+    Args:
+        hostname (str): Hostname of the request URL
+        no_proxy_rules (tuple): Result of _compile_no_proxy
+
+    Returns:
+        bool: True if the proxy should be bypassed for hostname
+    """
+    wildcard, exact_hosts, suffixes = no_proxy_rules
+    return wildcard or hostname in exact_hosts or hostname.endswith(suffixes)
+
+
+@functools.lru_cache(maxsize=32)
+def _strip_url_credentials(url):
+    """Remove userinfo from a URL (memoized per URL).
+
+    The same proxy URL is masked in every log line that mentions it, so
+    the parse is done once per distinct URL.
+
+    Args:
+        url (str): URL that may contain credentials
+
+    Returns:
+        str: URL without credentials
+
+    Raises:
+        ValueError: If the URL cannot be parsed
+    """
+    parsed = urlparse(url)
+    if not (parsed.username or parsed.password):
+        return url
+
+    if parsed.port:
+        netloc = f"{parsed.hostname}:{parsed.port}"
+    else:
+        netloc = parsed.hostname
+
+    sanitized = f"{parsed.scheme}://{netloc}"
+    if parsed.path:
+        sanitized += parsed.path
+    if parsed.params:
+        sanitized += f";{parsed.params}"
+    if parsed.query:
+        sanitized += f"?{parsed.query}"
+    if parsed.fragment:
+        sanitized += f"#{parsed.fragment}"
+
+    return sanitized
+
+
+def _json_dumps(obj):
+    """Encode an object as compact JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON without insignificant whitespace
+    """
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _format_bytes(size):
+    """Format bytes into human readable string.
+
+    Args:
+        size (int): Size in bytes
+
+    Returns:
+        str: Formatted size string
+    """
+    if size < 1024:
+        return f"{int(size)} B"
+    # bit_length picks the unit directly instead of dividing in a loop
+    index = min(4, (int(size).bit_length() - 1) // 10)
+    return f"{size / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
+
+
+def _preallocate(fileobj, size):
+    """Reserve disk space for a file that will be filled in place.
+
+    Uses posix_fallocate where available so the filesystem allocates the
+    extents once instead of on every write; elsewhere (or if the
+    filesystem refuses) the file is just extended.
+
+    Args:
+        fileobj: Binary file object opened for writing
+        size (int): Final file size in bytes
+    """
+    fileobj.flush()
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fileobj.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # e.g. EOPNOTSUPP on filesystems without fallocate
+    fileobj.truncate(size)
+
+
+def _default_cache_dir():
+    """Get the manifest cache directory, honouring XDG_CACHE_HOME.
+
+    Returns:
+        str: Path of the manifest cache directory (may not exist yet)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "dockerpull", "manifests")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_ssl_context(insecure, cafile=None):
+    """Get a shared SSL context, creating it on first use.
+
+    Building a context loads the CA store, so one is cached per
+    (insecure, cafile) combination and reused by every connection.
+    TLS versions older than 1.2 are refused.
+
+    Args:
+        insecure (bool): Disable certificate and hostname verification
+        cafile (str, optional): CA bundle to verify against
+
+    Returns:
+        ssl.SSLContext: Configured SSL context
+    """
+    ctx = ssl.create_default_context(cafile=cafile)
+    if hasattr(ssl, "TLSVersion"):
+        ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    else:
+        # Python 3.6 has no minimum_version
+        ctx.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+    if insecure:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
 # =============================================================================
 # CONFIGURATION CLASSES
 # =============================================================================
 
 
 class Config:
-    """Configuration management for Docker Image Puller"""
+    """Configuration management for Docker Image Puller
+
+    Blob downloads are read in chunk_size pieces (1 MiB by default). Larger
+    chunks mean fewer Python-level reads and let OpenSSL decrypt TLS records
+    in bulk, which matters on fast links; each concurrent download holds one
+    chunk in memory, so memory-constrained systems may prefer 256 KiB.
+
+    Blob transfers are bounded by chunk_timeout, the longest a single read
+    may wait for data; there is no limit on a transfer's total duration.
+    The timeout_config key download_timeout is deprecated: it is still
+    validated for compatibility but no longer used.
+    """
 
     def __init__(
-        self, auth_token=None, proxy_config=None, debug=False, timeout_config=None
+        self,
+        auth_token=None,
+        proxy_config=None,
+        debug=False,
+        timeout_config=None,
+        max_concurrent_downloads=3,
+        chunk_size=1024 * 1024,
+        fast_decompress=False,
+        manifest_cache=False,
     ):
         # Registry configuration
         self.registry_url = "https://registry-1.docker.io"
@@ -116,9 +374,28 @@ class Config:
         # Timeout configuration
         timeout_config = timeout_config or {}
         self.request_timeout = timeout_config.get("request_timeout", 30)
+        if "download_timeout" in timeout_config:
+            warnings.warn(
+                "download_timeout is deprecated and ignored; blob reads are "
+                "bounded by chunk_timeout",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.download_timeout = timeout_config.get("download_timeout", 300)
         self.chunk_timeout = timeout_config.get("chunk_timeout", 60)
 
+        # Download concurrency (matches dockerd's default of 3 parallel layers)
+        self.max_concurrent_downloads = max_concurrent_downloads
+
+        # Read size for streaming blob downloads
+        self.chunk_size = chunk_size
+
+        # Use ISA-L for layer decompression when the isal package is installed
+        self.fast_decompress = fast_decompress
+
+        # Where manifests are cached between runs (opt-in; None disables it)
+        self.manifest_cache_dir = _default_cache_dir() if manifest_cache else None
+
         # Validate configuration
         self._validate_config()
 
@@ -160,6 +437,10 @@ class Config:
             raise ValueError("download_timeout must be positive")
         if self.chunk_timeout <= 0:
             raise ValueError("chunk_timeout must be positive")
+        if self.max_concurrent_downloads <= 0:
+            raise ValueError("max_concurrent_downloads must be positive")
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
 
     def has_proxy(self):
         """Check if proxy configuration is present"""
@@ -180,16 +461,318 @@ class Config:
 # =============================================================================
 
 
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive HTTP(S) connections.
+
+    urllib opens a fresh TCP+TLS connection for every request and forces
+    "Connection: close". Pooling lets the token, manifest and blob requests
+    against the same registry host share a socket instead of paying a full
+    handshake each time.
+    """
+
+    def __init__(self, max_idle_per_host=8):
+        """Initialize connection pool.
+
+        Args:
+            max_idle_per_host (int): Idle connections kept open per host
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Take an idle connection for key, or None if none is available"""
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                return connections.pop()
+        return None
+
+    def put(self, key, conn):
+        """Return a connection to the pool, closing it if it is unusable"""
+        if conn.sock is None:
+            return
+
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.max_idle_per_host:
+                connections.append(conn)
+                return
+
+        conn.close()
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back to the pool when closed.
+
+    A short unread body of known length (HEAD responses, redirects, error
+    pages) is read off first; otherwise the connection is only reusable if
+    the caller read the body to the end.
+    """
+
+    _release = None
+
+    def close(self):
+        if (
+            self._release is not None
+            and self.fp is not None
+            and not self.chunked
+            and self.length is not None
+            and self.length <= _DRAIN_LIMIT
+        ):
+            try:
+                self.read()
+            except (OSError, http.client.HTTPException):
+                pass
+
+        # fp is cleared by http.client once the body has been fully read;
+        # only then is the connection in a state where it can be reused
+        drained = self.fp is None
+        super().close()
+
+        release = self._release
+        if release is not None:
+            self._release = None
+            release(drained and not self.will_close)
+
+
+def _pooled_open(pool, http_class, req, **conn_args):
+    """Open a urllib request over a pooled keep-alive connection.
+
+    Mirrors urllib's AbstractHTTPHandler.do_open, minus the forced
+    "Connection: close", and retries once on a fresh connection if a reused
+    idle connection turns out to have been dropped by the server.
+
+    Args:
+        pool (ConnectionPool): Pool to take connections from and return them to
+        http_class (type): HTTPConnection or HTTPSConnection
+        req (Request): Prepared urllib request
+        **conn_args: Extra connection arguments (e.g. SSL context)
+
+    Returns:
+        http.client.HTTPResponse: Response compatible with urlopen results
+    """
+    host = req.host
+    if not host:
+        raise URLError("no host given")
+
+    headers = dict(req.unredirected_hdrs)
+    headers.update({k: v for k, v in req.headers.items() if k not in headers})
+    headers = {name.title(): val for name, val in headers.items()}
+
+    tunnel_headers = {}
+    if req._tunnel_host and "Proxy-Authorization" in headers:
+        tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+
+    key = (http_class.__name__, host, req._tunnel_host)
+
+    while True:
+        conn = pool.get(key)
+        reused = conn is not None
+        if conn is None:
+            conn = http_class(host, timeout=req.timeout, **conn_args)
+            conn.response_class = _PooledHTTPResponse
+            if req._tunnel_host:
+                conn.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+        else:
+            conn.timeout = req.timeout
+            if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                conn.sock.settimeout(socket.getdefaulttimeout())
+            else:
+                conn.sock.settimeout(req.timeout)
+
+        try:
+            conn.request(
+                req.get_method(),
+                req.selector,
+                req.data,
+                headers,
+                encode_chunked=req.has_header("Transfer-encoding"),
+            )
+            response = conn.getresponse()
+        except (OSError, http.client.HTTPException) as err:
+            conn.close()
+            if reused:
+                # Idle connection was closed by the server; retry on a new one
+                continue
+            if isinstance(err, OSError):
+                raise URLError(err)
+            raise
+        break
+
+    def release(reusable):
+        if reusable:
+            pool.put(key, conn)
+        else:
+            conn.close()
+
+    response._release = release
+    response.url = req.get_full_url()
+    response.msg = response.reason
+    return response
+
+
+class KeepAliveHTTPHandler(urllib.request.HTTPHandler):
+    """HTTP handler that reuses connections from a ConnectionPool"""
+
+    def __init__(self, pool):
+        super().__init__()
+        self.pool = pool
+
+    def http_open(self, req):
+        return _pooled_open(self.pool, http.client.HTTPConnection, req)
+
+
+class KeepAliveHTTPSHandler(urllib.request.HTTPSHandler):
+    """HTTPS handler that reuses connections from a ConnectionPool"""
+
+    def __init__(self, pool, context=None):
+        super().__init__(context=context)
+        self.pool = pool
+        self.context = context
+
+    def https_open(self, req):
+        return _pooled_open(
+            self.pool, http.client.HTTPSConnection, req, context=self.context
+        )
+
+
+class GunzipWriter:
+    """File-like sink that gunzips written bytes into another file.
+
+    Lets a gzip-compressed layer be decompressed while it is downloading,
+    so the compressed form never has to be stored on disk.
+    """
+
+    def __init__(self, fileobj, max_output=1024 * 1024, zlib_module=zlib):
+        """Initialize gunzip writer.
+
+        Args:
+            fileobj: Binary file object receiving decompressed data
+            max_output (int): Upper bound on bytes inflated per step, which
+                keeps memory flat for highly compressible input
+            zlib_module: zlib-compatible module providing decompressobj
+                (stdlib zlib or isal.isal_zlib)
+        """
+        self.fileobj = fileobj
+        self.max_output = max_output
+        self.zlib_module = zlib_module
+        self._decompressor = zlib_module.decompressobj(wbits=31)  # gzip container
+
+    def write(self, data):
+        """Decompress a chunk of gzip data and write the result"""
+        size = len(data)
+        while data:
+            self.fileobj.write(self._decompressor.decompress(data, self.max_output))
+
+            if not self._decompressor.eof:
+                data = self._decompressor.unconsumed_tail
+                continue
+
+            # Concatenated gzip members are valid; anything else is padding
+            data = self._decompressor.unused_data
+            if not data.startswith(b"\x1f\x8b"):
+                break
+            self._decompressor = self.zlib_module.decompressobj(wbits=31)
+
+        return size
+
+    def close(self):
+        """Flush remaining output and check the gzip stream was complete"""
+        self.fileobj.write(self._decompressor.flush())
+        if not self._decompressor.eof:
+            raise EOFError("Compressed layer ended before the end-of-stream marker")
+
+
+class ProgressWriter:
+    """File-like sink that counts written bytes into a progress reporter.
+
+    Lets shutil.copyfileobj drive a download while progress is reported,
+    so the copy loop stays in one call instead of a Python read/write loop.
+    """
+
+    def __init__(self, fileobj, progress_reporter):
+        """Initialize progress writer.
+
+        Args:
+            fileobj: Binary file object receiving the data
+            progress_reporter (ProgressReporter): Reporter to feed
+        """
+        self.fileobj = fileobj
+        self.progress_reporter = progress_reporter
+        self.written = 0
+
+    def write(self, data):
+        """Write a chunk and report its size"""
+        size = self.fileobj.write(data)
+        self.written += size
+        self.progress_reporter.update(size)
+        return size
+
+
+class NoAuthRedirectHandler(HTTPRedirectHandler):
+    """Redirect handler that strips the Authorization header.
+
+    Registries redirect blob downloads to CDN/S3 URLs which must not
+    receive the registry bearer token.
+    """
+
+
+def _make_no_auth_redirect(code):
+    """Build an http_error_<code> method that drops Authorization first"""
+    redirect = getattr(HTTPRedirectHandler, f"http_error_{code}")
+
+    def http_error(self, req, fp, code, msg, headers):
+        if "Authorization" in req.headers:
+            del req.headers["Authorization"]
+        return redirect(self, req, fp, code, msg, headers)
+
+    return http_error
+
+
+# 308 handling only exists in HTTPRedirectHandler on newer Pythons
+for _code in (301, 302, 303, 307, 308):
+    if hasattr(HTTPRedirectHandler, f"http_error_{_code}"):
+        setattr(
+            NoAuthRedirectHandler, f"http_error_{_code}", _make_no_auth_redirect(_code)
+        )
+del _code
+
+
 class ProxyManager:
     """Handles proxy configuration and URL sanitization"""
 
     def __init__(self, config):
         self.config = config
         self.no_proxy_list = config.get_no_proxy_list()
+        self._no_proxy_rules = _compile_no_proxy(self.no_proxy_list)
+        self.connection_pool = ConnectionPool()
         self.setup_proxy()
 
+    def get_keep_alive_handlers(self):
+        """Get urllib handlers that share this manager's connection pool.
+
+        Returns:
+            list: HTTP and HTTPS handlers backed by the connection pool
+        """
+        context = _get_ssl_context(bool(self.config.proxy_config.get("insecure")))
+        return [
+            KeepAliveHTTPHandler(self.connection_pool),
+            KeepAliveHTTPSHandler(self.connection_pool, context),
+        ]
+
     def setup_proxy(self):
-        """Configure proxy settings for urllib"""
+        """Configure proxy settings for urllib.
+
+        Builds two openers once: proxy_opener (installed as the urllib
+        default) and direct_opener for no_proxy hosts, so requests pick one
+        instead of editing proxy environment variables.
+        """
+        # Empty ProxyHandler so neither configured nor environment proxies apply
+        self.direct_opener = build_opener(
+            ProxyHandler({}), NoAuthRedirectHandler, *self.get_keep_alive_handlers()
+        )
+
         if not self.config.has_proxy():
             self._setup_no_proxy()
             return
@@ -222,74 +805,21 @@ class ProxyManager:
 
         proxy_handler = ProxyHandler(proxy_handlers)
 
-        # Create redirect handler that strips auth headers
-        class NoAuthRedirectHandler(HTTPRedirectHandler):
-            def http_error_301(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_301(req, fp, code, msg, headers)
-
-            def http_error_302(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_302(req, fp, code, msg, headers)
-
-            def http_error_303(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_303(req, fp, code, msg, headers)
-
-            def http_error_307(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_307(req, fp, code, msg, headers)
-
         if self.config.proxy_config.get("insecure"):
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            https_handler = urllib.request.HTTPSHandler(context=ctx)
-            opener = build_opener(proxy_handler, https_handler, NoAuthRedirectHandler)
             logger.info("  SSL Verification: Disabled (insecure mode)")
-        else:
-            opener = build_opener(proxy_handler, NoAuthRedirectHandler)
 
-        install_opener(opener)
+        self.proxy_opener = build_opener(
+            proxy_handler, NoAuthRedirectHandler, *self.get_keep_alive_handlers()
+        )
+        install_opener(self.proxy_opener)
 
     def _setup_no_proxy(self):
         """Setup opener without proxy"""
-
-        class NoAuthRedirectHandler(HTTPRedirectHandler):
-            def http_error_301(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_301(req, fp, code, msg, headers)
-
-            def http_error_302(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_302(req, fp, code, msg, headers)
-
-            def http_error_303(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_303(req, fp, code, msg, headers)
-
-            def http_error_307(self, req, fp, code, msg, headers):
-                if "Authorization" in req.headers:
-                    del req.headers["Authorization"]
-                return super().http_error_307(req, fp, code, msg, headers)
-
-        if self.config.proxy_config.get("insecure"):
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            https_handler = urllib.request.HTTPSHandler(context=ctx)
-            opener = build_opener(https_handler, NoAuthRedirectHandler)
-        else:
-            opener = build_opener(NoAuthRedirectHandler)
-
-        install_opener(opener)
+        # build_opener still honours proxies from the environment here
+        self.proxy_opener = build_opener(
+            NoAuthRedirectHandler, *self.get_keep_alive_handlers()
+        )
+        install_opener(self.proxy_opener)
 
     def _add_proxy_auth(self, proxy_url, auth_string):
         """Add authentication credentials to proxy URL.
@@ -320,48 +850,25 @@ class ProxyManager:
 
     def sanitize_proxy_url(self, url):
         """Remove credentials from proxy URL for display"""
-        if not url:
+        # Credentials need an "@", so most URLs skip parsing entirely
+        if not url or "@" not in url:
             return url
 
         try:
-            parsed = urlparse(url)
-            if parsed.username or parsed.password:
-                if parsed.port:
-                    netloc = f"{parsed.hostname}:{parsed.port}"
-                else:
-                    netloc = parsed.hostname
-
-                sanitized = f"{parsed.scheme}://{netloc}"
-                if parsed.path:
-                    sanitized += parsed.path
-                if parsed.params:
-                    sanitized += f";{parsed.params}"
-                if parsed.query:
-                    sanitized += f"?{parsed.query}"
-                if parsed.fragment:
-                    sanitized += f"#{parsed.fragment}"
-
-                return sanitized
+            return _strip_url_credentials(url)
         except (ValueError, TypeError, AttributeError):
             return self._mask_credentials_fallback(url)
 
-        return url
-
     def _mask_credentials_fallback(self, text):
         """Fallback credential masking for malformed URLs or general text"""
-        if not text:
+        # Both patterns need an "@", so most text can skip the regex engine
+        if not text or "@" not in text:
             return text
 
-        patterns = [
-            r"://[^:/@]+:[^@]+@",  # ://user:pass@
-            r"://[^:/@]+@",  # ://user@
-        ]
+        for pattern in _CRED_PATTERNS:
+            text = pattern.sub(_CRED_REPL, text)
 
-        result = text
-        for pattern in patterns:
-            result = re.sub(pattern, "://***:***@", result)
-
-        return result
+        return text
 
     def sanitize_debug_output(self, text):
         """Sanitize any text that might contain credentials for debug output"""
@@ -372,44 +879,59 @@ class ProxyManager:
 
     def should_bypass_proxy(self, hostname):
         """Check if hostname should bypass proxy"""
-        if not self.no_proxy_list:
+        if not self.no_proxy_list or not hostname:
             return False
 
-        for no_proxy_host in self.no_proxy_list:
-            if no_proxy_host == "*":
-                return True
-            elif no_proxy_host.startswith(".") and hostname.endswith(no_proxy_host):
-                return True
-            elif hostname == no_proxy_host or hostname.endswith("." + no_proxy_host):
-                return True
-
-        return False
+        return _bypass(hostname, self._no_proxy_rules)
 
 
 class ProgressReporter:
     """Enhanced progress reporting with Unicode progress bars and ETA calculation"""
 
-    def __init__(self, total_size=None, description="Download", show_speed=True):
+    def __init__(
+        self,
+        total_size=None,
+        description="Download",
+        show_speed=True,
+        renderer=None,
+        parent=None,
+    ):
         """Initialize progress reporter.
 
         Args:
             total_size (int, optional): Total expected size in bytes
             description (str): Description to show before progress bar
             show_speed (bool): Whether to show download speed and ETA
+            renderer (MultiProgressRenderer, optional): Renderer that draws
+                this reporter's line; updates then do no terminal I/O
+            parent (ProgressReporter, optional): Reporter that also receives
+                every update, e.g. an overall total
         """
         self.total_size = total_size
         self.downloaded = 0
         self.description = description
         self.show_speed = show_speed
+        self.renderer = renderer
+        self.parent = parent
         self.start_time = self._get_time()
         self.last_update = self.start_time
+        self._last_update_bytes = 0
+
+        # Serializes updates when shared between download threads
+        self._lock = threading.Lock()
 
         # Terminal width detection
         self.terminal_width = self._get_terminal_width()
 
+        # Last rendered line, to skip redundant terminal writes
+        self._last_line = None
+
+        if renderer is not None:
+            renderer.add(self)
+
     def _get_time(self):
-        """Get current time in seconds"""
-        return time.time()
+        """Get current monotonic time in seconds"""
+        return time.monotonic()
 
     def _get_terminal_width(self):
         """Get terminal width, default to 80 if detection fails"""
@@ -427,20 +949,76 @@ class ProgressReporter:
         if bytes_downloaded <= 0:
             return
 
-        self.downloaded += bytes_downloaded
-        current_time = self._get_time()
+        if self.parent is not None:
+            self.parent.update(bytes_downloaded)
 
-        # Throttle display updates
-        if current_time - self.last_update < 0.1 and self.downloaded < (
-            self.total_size or float("inf")
-        ):
+        with self._lock:
+            self.downloaded += bytes_downloaded
+
+            # The renderer draws on its own schedule
+            if self.renderer is not None:
+                return
+
+            # Throttle display updates by bytes, then by time; the final
+            # update always draws
+            complete = self.downloaded >= (self.total_size or float("inf"))
+            if (
+                not complete
+                and self.downloaded - self._last_update_bytes < _PROGRESS_MIN_BYTES
+            ):
+                return
+
+            current_time = self._get_time()
+            if not complete and current_time - self.last_update < _PROGRESS_INTERVAL:
+                return
+
+            self._display_progress(current_time)
+            self.last_update = current_time
+            self._last_update_bytes = self.downloaded
+
+    def rollback(self, bytes_downloaded):
+        """Take back bytes reported by a transfer that failed and is retried.
+
+        Args:
+            bytes_downloaded (int): Bytes to subtract from the progress
+        """
+        if bytes_downloaded <= 0:
+            return
+
+        if self.parent is not None:
+            self.parent.rollback(bytes_downloaded)
+
+        with self._lock:
+            self.downloaded -= bytes_downloaded
+            self._last_update_bytes = min(self._last_update_bytes, self.downloaded)
+
+    def _display_progress(self, current_time=None):
+        """Display current progress bar and stats
+
+        Args:
+            current_time (float, optional): Time of this update, so the clock
+                is read only once per update
+        """
+        progress_line = self._render_line(current_time)
+
+        # Skip the write when nothing visible changed
+        if progress_line == self._last_line:
             return
+        self._last_line = progress_line
 
-        self._display_progress()
-        self.last_update = current_time
+        # Print with carriage return for overwrite
+        sys.stdout.write(f"\r{progress_line}")
+        sys.stdout.flush()
+
+    def _render_line(self, current_time=None):
+        """Format the progress bar and stats as a single line.
+
+        Args:
+            current_time (float, optional): Time to compute speed and ETA at
 
-    def _display_progress(self):
-        """Display current progress bar and stats"""
+        Returns:
+            str: Progress line sized to the terminal width
+        """
         # Calculate progress percentage
         if self.total_size:
             progress_pct = min(100.0, (self.downloaded / self.total_size) * 100)
@@ -449,20 +1027,17 @@ class ProgressReporter:
 
         # Format downloaded amount
         downloaded_str = self._format_bytes(self.downloaded)
-
-        # Build progress bar
         if self.total_size:
-            total_str = self._format_bytes(self.total_size)
-            size_info = f"{downloaded_str}/{total_str}"
-            progress_bar = self._build_progress_bar(progress_pct)
+            size_info = f"{downloaded_str}/{self._format_bytes(self.total_size)}"
         else:
             size_info = downloaded_str
-            progress_bar = f"[{'█' * 10}] ???%"
 
         # Calculate speed and ETA
         speed_info = ""
         if self.show_speed:
-            elapsed = self._get_time() - self.start_time
+            if current_time is None:
+                current_time = self._get_time()
+            elapsed = current_time - self.start_time
             if elapsed > 0:
                 speed = self.downloaded / elapsed
                 speed_str = f"{self._format_bytes(speed)}/s"
@@ -474,29 +1049,33 @@ class ProgressReporter:
                 else:
                     speed_info = f" | {speed_str}"
 
-        # Build complete progress line
-        progress_line = f"  {self.description}: {progress_bar} {size_info}{speed_info}"
-
-        # Truncate to terminal width if needed
-        if len(progress_line) > self.terminal_width:
-            available = (
-                self.terminal_width
-                - len(f"  {self.description}: ")
-                - len(size_info)
-                - len(speed_info)
-                - 3
-            )
-            if available > 10:  # Minimum width required
-                progress_bar = self._build_progress_bar(progress_pct, available)
-                progress_line = (
-                    f"  {self.description}: {progress_bar} {size_info}{speed_info}"
+        # Size the bar from the text around it so it is built exactly once;
+        # 15 covers "  : ", the brackets, " 100.0%", the separator and a
+        # spare column so the line never wraps
+        available = (
+            self.terminal_width
+            - len(self.description)
+            - len(size_info)
+            - len(speed_info)
+            - 15
+        )
+
+        if available < 10:
+            # Minimal display for narrow terminals
+            progress_line = f"  {downloaded_str} {int(progress_pct)}%"
+        else:
+            if self.total_size:
+                progress_bar = self._build_progress_bar(
+                    progress_pct, min(30, available)
                 )
             else:
-                # Minimal display for narrow terminals
-                progress_line = f"  {downloaded_str} {int(progress_pct)}%"
+                progress_bar = f"[{'█' * 10}] ???%"
 
-        # Print with carriage return for overwrite
-        print(f"\r{progress_line}", end="", flush=True)
+            progress_line = (
+                f"  {self.description}: {progress_bar} {size_info}{speed_info}"
+            )
+
+        return progress_line
 
     def _build_progress_bar(self, progress_pct, width=30):
         """Build Unicode progress bar.
@@ -536,23 +1115,8 @@ class ProgressReporter:
 
         return f"[{bar_content[:width]}] {progress_pct:5.1f}%"
 
-    def _format_bytes(self, size):
-        """Format bytes into human readable string.
-
-        Args:
-            size (int): Size in bytes
-
-        Returns:
-            str: Formatted size string
-        """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                if unit == "B":
-                    return f"{int(size)} {unit}"
-                else:
-                    return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+    # Module-level helper, shared with DockerImagePuller
+    _format_bytes = staticmethod(_format_bytes)
 
     def _format_duration(self, seconds):
         """Format duration into human readable string.
@@ -576,108 +1140,373 @@ class ProgressReporter:
 
     def finish(self):
         """Complete the progress display with a newline"""
+        if self.renderer is not None:
+            return  # The renderer owns the terminal lines
         if self.downloaded > 0:
+            # Draw bytes held back by the throttle (unknown total size)
+            if self.downloaded != self._last_update_bytes:
+                self._display_progress()
             print()  # New line to finish progress display
 
 
+class MultiProgressRenderer:
+    """Draw several progress reporters as a block of terminal lines.
+
+    Attached reporters only count bytes; a background thread redraws the
+    whole block ten times a second with one write, so concurrent downloads
+    neither tear each other's lines nor hit stdout on every chunk. Reporters
+    are removed when their download ends, keeping the block short enough to
+    redraw in place. Needs an ANSI terminal, so only use it when stdout is
+    a tty.
+    """
+
+    def __init__(self, interval=0.1, stream=None):
+        """Initialize the renderer.
+
+        Args:
+            interval (float): Seconds between redraws
+            stream: Text stream to draw on (defaults to sys.stdout)
+        """
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stdout
+        self._reporters = []
+        self._lines_drawn = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # Log handlers writing through the renderer, with their own streams
+        self._redirected = []
+
+    def add(self, reporter):
+        """Append a reporter's line to the block.
+
+        Args:
+            reporter (ProgressReporter): Reporter to draw
+        """
+        with self._lock:
+            self._reporters.append(reporter)
+
+    def remove(self, reporter):
+        """Drop a reporter's line from the block (e.g. when its download ends).
+
+        Args:
+            reporter (ProgressReporter): Reporter previously added
+        """
+        with self._lock:
+            if reporter in self._reporters:
+                self._reporters.remove(reporter)
+
+    def start(self, handlers=()):
+        """Start redrawing in a background thread.
+
+        Args:
+            handlers (iterable): Logging handlers to route through the
+                renderer; those writing to the same stream have each record
+                written above the block instead of over it
+        """
+        for handler in handlers:
+            if getattr(handler, "stream", None) is self.stream:
+                handler.acquire()
+                try:
+                    handler.stream = _RendererStream(self)
+                finally:
+                    handler.release()
+                self._redirected.append(handler)
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="progress-renderer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        """Redraw until stopped"""
+        while not self._stop.wait(self.interval):
+            self.render()
+
+    def render(self):
+        """Redraw every reporter line in place with a single write"""
+        with self._lock:
+            self.stream.write(self._move_to_top() + self._draw_lines())
+            self.stream.flush()
+
+    def write_above(self, text):
+        """Write text (e.g. a log record) above the block, then redraw it.
+
+        Args:
+            text (str): Text to write, normally ending in a newline
+        """
+        with self._lock:
+            # Erase the block, print the text where it was, draw it below
+            self.stream.write(self._move_to_top() + text + self._draw_lines())
+            self.stream.flush()
+
+    def _move_to_top(self):
+        """Escape sequence returning to the first line of the drawn block"""
+        if not self._lines_drawn:
+            return ""
+        return f"\x1b[{self._lines_drawn}A\r\x1b[J"
+
+    def _draw_lines(self):
+        """Render the current block (caller holds the lock)
+
+        Returns:
+            str: One line per reporter
+        """
+        now = time.monotonic()
+        lines = [
+            f"\r{reporter._render_line(now)}\x1b[K\n" for reporter in self._reporters
+        ]
+        self._lines_drawn = len(lines)
+        return "".join(lines)
+
+    def close(self):
+        """Stop the background thread and draw the final state"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.render()
+
+        for handler in self._redirected:
+            handler.acquire()
+            try:
+                handler.stream = self.stream
+            finally:
+                handler.release()
+        self._redirected = []
+
+
+class _RendererStream:
+    """File-like stand-in for a log handler's stream while a renderer runs.
+
+    Each write goes above the progress block, so log records are neither
+    overwritten by the next frame nor left in the middle of it.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+
+    def write(self, text):
+        if text:
+            self.renderer.write_above(text)
+
+    def flush(self):
+        self.renderer.stream.flush()
+
+
 # =============================================================================
 # CORE FUNCTIONALITY
 # =============================================================================
 
 
+def _config_property(name):
+    """Build a read-only property exposing one Config attribute.
+
+    Args:
+        name (str): Config attribute name
+
+    Returns:
+        property: Property reading self.config.<name>
+    """
+    return property(
+        lambda self: getattr(self.config, name), doc=f"Config.{name} (read-only)"
+    )
+
+
+class PullError(Exception):
+    """Raised when an image can't be pulled (auth, manifest or download)."""
+
+
 class DockerImagePuller:
     def __init__(
-        self, auth_token=None, proxy_config=None, debug=False, timeout_config=None
+        self,
+        auth_token=None,
+        proxy_config=None,
+        debug=False,
+        timeout_config=None,
+        max_concurrent_downloads=3,
+        chunk_size=1024 * 1024,
+        fast_decompress=False,
+        manifest_cache=False,
     ):
         # Create configuration object
-        self.config = Config(auth_token, proxy_config, debug, timeout_config)
+        self.config = Config(
+            auth_token,
+            proxy_config,
+            debug,
+            timeout_config,
+            max_concurrent_downloads,
+            chunk_size,
+            fast_decompress,
+            manifest_cache,
+        )
 
-        # Public API attributes - provide direct access to configuration
-        self.registry_url = self.config.registry_url
-        self.auth_url = self.config.auth_url
-        self.auth_token = self.config.auth_token
-        self.proxy_config = self.config.proxy_config
-        self.request_timeout = self.config.request_timeout
-        self.download_timeout = self.config.download_timeout
-        self.chunk_timeout = self.config.chunk_timeout
+        # Decompression backend for streamed layers
+        self.zlib_module = zlib
+        if self.config.fast_decompress:
+            if isal_zlib is not None:
+                self.zlib_module = isal_zlib
+            else:
+                logger.warning(
+                    "--fast-decompress requested but isal is not installed, using zlib"
+                )
 
         # Create proxy manager
         self.proxy_manager = ProxyManager(self.config)
 
-        # Set up no_proxy_list for direct access
-        self.no_proxy_list = self.proxy_manager.no_proxy_list
+        # HEAD probe results per (registry, image): CDN redirect and range
+        # support are the same for every blob of an image
+        self._blob_probe_cache = {}
+
+        # Parsed multi-arch indexes per (registry, image, tag), so pulling
+        # several platforms of one tag fetches its index only once
+        self._index_cache = {}
+
+    # Read-only views of the Config, which stays the single source of truth
+    registry_url = _config_property("registry_url")
+    auth_url = _config_property("auth_url")
+    auth_token = _config_property("auth_token")
+    proxy_config = _config_property("proxy_config")
+    request_timeout = _config_property("request_timeout")
+    download_timeout = _config_property("download_timeout")
+    chunk_timeout = _config_property("chunk_timeout")
+    max_concurrent_downloads = _config_property("max_concurrent_downloads")
+    chunk_size = _config_property("chunk_size")
+
+    @property
+    def no_proxy_list(self):
+        """Hosts that bypass the proxy - delegated to ProxyManager"""
+        return self.proxy_manager.no_proxy_list
 
     def setup_proxy(self):
         """Configure proxy settings for urllib - delegated to ProxyManager"""
         self.proxy_manager.setup_proxy()
 
-    def add_proxy_auth(self, proxy_url, auth_string):
-        """Add authentication to proxy URL - delegated to ProxyManager"""
-        return self.proxy_manager._add_proxy_auth(proxy_url, auth_string)
-
     def sanitize_proxy_url(self, url):
         """Remove credentials from proxy URL for display - delegated to ProxyManager"""
         return self.proxy_manager.sanitize_proxy_url(url)
 
-    def _mask_credentials_fallback(self, text):
-        """Fallback credential masking - delegated to ProxyManager"""
-        return self.proxy_manager._mask_credentials_fallback(text)
-
     def sanitize_debug_output(self, text):
-        """Sanitize any text that might contain credentials for debug output - delegated to ProxyManager"""
+        """Mask credentials in debug output - delegated to ProxyManager"""
         return self.proxy_manager.sanitize_debug_output(text)
 
-    def _stream_download(self, response, digest, expected_size=None):
-        """Stream download with progress tracking and memory efficiency.
+    def add_proxy_auth(self, proxy_url, auth_string):
+        """Add authentication to proxy URL - delegated to ProxyManager"""
+        return self.proxy_manager._add_proxy_auth(proxy_url, auth_string)
 
-        Downloads large blobs using streaming to avoid memory issues.
+    def _stream_download(
+        self,
+        response,
+        digest,
+        expected_size=None,
+        progress_reporter=None,
+        decompress=False,
+        output_dir=None,
+        resume=None,
+    ):
+        """Stream download to disk with progress tracking and memory efficiency.
+
+        Downloads blobs chunk by chunk into a temporary file so large layers
+        never have to be held in memory, verifying the content digest on the
+        fly. Gzip-compressed layers can be decompressed while streaming so
+        only the uncompressed tar is written. The caller owns the returned
+        file and must remove it once the blob has been consumed.
+        Blobs whose size is known to be under 1 MiB (configs, empty layers)
+        skip the filesystem and are returned as bytes, still compressed.
         Includes enhanced progress reporting with Unicode bars and ETA.
 
         Args:
             response: HTTP response object to stream from
-            digest (str): Blob digest for identification in error messages
+            digest (str): Blob digest (e.g., 'sha256:...') to verify against
             expected_size (int, optional): Expected download size in bytes
+            progress_reporter (ProgressReporter, optional): Shared reporter to
+                feed instead of drawing a per-blob progress bar
+            decompress (bool): Gunzip the blob while writing it if it is
+                gzip-compressed (the digest is still checked on the raw bytes)
+            output_dir (str, optional): Directory for the blob file
+            resume (callable, optional): Called with the number of bytes
+                received when the transfer breaks off; returns a response
+                continuing from that offset, or None if it can't
 
         Returns:
-            bytes: Downloaded data, or None if download failed
+            str or bytes: Path to the downloaded blob file, or the blob
+                content for small blobs; None if download failed or the
+                content did not match its digest
 
         Raises:
-            TimeoutError: If download stalls or chunk timeout exceeded
+            TimeoutError: If a read waits longer than chunk_timeout
         """
 
-        # Setup timeout handling for stuck downloads
-        def timeout_handler(_signum, _frame):
-            raise TimeoutError(f"Download chunk timeout after {self.chunk_timeout}s")
+        # Blobs are content-addressed; hash while streaming so verification
+        # needs no second pass over the file
+        algorithm, _, expected_hash = digest.partition(":")
+        hasher = hashlib.new(algorithm) if algorithm in ("sha256", "sha512") else None
 
-        # Use temporary file for streaming
-        temp_data = tempfile.NamedTemporaryFile(delete=False)
+        if expected_size and expected_size < _SMALL_BLOB_LIMIT:
+            return self._read_small_blob(
+                response, digest, expected_size, hasher, progress_reporter
+            )
+
+        # Stream to a temporary file on disk so memory use stays at one chunk
+        # regardless of blob size
+        temp_data = tempfile.NamedTemporaryFile(delete=False, dir=output_dir)
+        sink = None
+        completed = False
         total_size = 0
-        chunk_size = 65536  # 64KB chunks
-        last_activity = time.time()
+        chunk_size = self.chunk_size
+        resumes = 0
 
         # Initialize progress reporter for files > 1MB
-        progress_reporter = None
-        if expected_size and expected_size > 1024 * 1024:  # Over 1MB
+        shared_progress = progress_reporter is not None
+        if (
+            not shared_progress and expected_size and expected_size > 1024 * 1024
+        ):  # Over 1MB
             blob_name = digest[:12] + "..." if len(digest) > 12 else digest
             progress_reporter = ProgressReporter(expected_size, f"Layer {blob_name}")
 
         try:
-            if hasattr(signal, "SIGALRM"):  # Unix systems only
-                signal.signal(signal.SIGALRM, timeout_handler)
-
+            # Stuck reads are bounded by the socket timeout (chunk_timeout)
+            # the response was opened with, which also works off the main thread
             while True:
-                if hasattr(signal, "SIGALRM"):
-                    signal.alarm(self.chunk_timeout)
-
                 try:
-                    chunk = response.read(chunk_size)
+                    try:
+                        chunk = response.read(chunk_size)
+                        if not chunk and expected_size and total_size < expected_size:
+                            raise http.client.IncompleteRead(b"", expected_size)
+                    except (OSError, http.client.HTTPException) as e:
+                        # Hashing and gunzip state live on in this call, so
+                        # the transfer continues where it stopped
+                        if resume is None or resumes >= _RESUME_ATTEMPTS:
+                            raise
+                        resumes += 1
+                        logger.warning(
+                            f"Download of {digest[:19]} interrupted after "
+                            f"{self._format_bytes(total_size)} ({e!r}), resuming"
+                        )
+                        response.close()
+                        response = resume(total_size)
+                        if response is None:
+                            raise
+                        continue
+
                     if not chunk:
                         break
 
-                    temp_data.write(chunk)
+                    # Pick the output path from the gzip magic number
+                    if sink is None:
+                        if decompress and chunk[:2] == b"\x1f\x8b":
+                            sink = GunzipWriter(temp_data, chunk_size, self.zlib_module)
+                        else:
+                            sink = temp_data
+
+                    # Digest covers the bytes as served, so hash before gunzip
+                    if hasher:
+                        hasher.update(chunk)
+                    sink.write(chunk)
                     chunk_len = len(chunk)
                     total_size += chunk_len
-                    last_activity = time.time()
 
                     # Update progress reporter
                     if progress_reporter:
@@ -687,87 +1516,371 @@ class DockerImagePuller:
                         mb_downloaded = total_size / (1024 * 1024)
                         print(f"  Downloaded {mb_downloaded:.1f} MB...", end="\r")
 
-                    # Check for stalled downloads
-                    if time.time() - last_activity > self.chunk_timeout:
-                        raise TimeoutError(
-                            f"Download stalled - no data received for {self.chunk_timeout}s"
-                        )
-
                 except socket.timeout:
-                    raise TimeoutError("Download chunk timeout")
-                finally:
-                    if hasattr(signal, "SIGALRM"):
-                        signal.alarm(0)  # Cancel timeout
+                    raise TimeoutError(
+                        f"Download chunk timeout after {self.chunk_timeout}s"
+                    )
 
-            # Finish progress reporting
-            if progress_reporter:
-                progress_reporter.finish()
-            elif total_size > 1024 * 1024:
-                print()  # New line after fallback progress
+            # Finish progress reporting (shared reporters are finished by owner)
+            if not shared_progress:
+                if progress_reporter:
+                    progress_reporter.finish()
+                elif total_size > 1024 * 1024:
+                    print()  # New line after fallback progress
 
-            # Read the data back from temp file
-            temp_data.close()
-            with open(temp_data.name, "rb") as f:
-                data = f.read()
+            if isinstance(sink, GunzipWriter):
+                sink.close()
 
-            return data
+            # Verify content against its digest
+            if hasher and hasher.hexdigest() != expected_hash:
+                logger.error(
+                    f"Digest mismatch for blob {digest}: got {algorithm}:{hasher.hexdigest()}"
+                )
+                return None
+
+            # Hand the file to the caller; it is removed once consumed
+            temp_data.close()
+            completed = True
+            return temp_data.name
 
         except (TimeoutError, socket.timeout) as e:
-            if progress_reporter:
+            if progress_reporter and not shared_progress:
                 progress_reporter.finish()
             logger.error(f"Download timeout for blob {digest}: {e}")
             return None
         except Exception as e:
-            if progress_reporter:
+            if progress_reporter and not shared_progress:
                 progress_reporter.finish()
             logger.error(f"Streaming error for blob {digest}: {e}")
             return None
         finally:
-            # Cleanup
-            if hasattr(signal, "SIGALRM"):
-                signal.alarm(0)
+            # Cleanup; a resumed response is ours to close, the original
+            # belongs to the caller
+            if resumes and response is not None:
+                response.close()
             temp_data.close()
+            if not completed:
+                self._remove_blob_file(temp_data.name)
+
+    def _download_ranged(
+        self,
+        url,
+        headers,
+        digest,
+        size,
+        progress_reporter=None,
+        output_dir=None,
+        open_func=None,
+    ):
+        """Download a large blob as concurrent byte ranges.
+
+        Splits the blob into _RANGE_PART_SIZE parts fetched by up to
+        _RANGE_WORKERS threads with Range requests. Each part is written at
+        its offset in a preallocated file, then the whole file is hashed
+        against the digest. The blob is left compressed; create_docker_tar
+        decompresses it.
+
+        Args:
+            url (str): Blob URL (the CDN URL if the registry redirected)
+            headers (dict): Request headers to send with every range
+            digest (str): Blob digest (e.g., 'sha256:...') to verify against
+            size (int): Blob size in bytes from the HEAD probe
+            progress_reporter (ProgressReporter, optional): Shared reporter to
+                feed instead of drawing a per-blob progress bar
+            output_dir (str, optional): Directory for the blob file
+            open_func (callable, optional): Opener used for every range;
+                defaults to the proxy-aware opener
+
+        Returns:
+            str: Path to the downloaded blob file (owned by the caller), or
+                None if any range failed or the content did not match
+        """
+        if open_func is None:
+            open_func = self.proxy_manager.proxy_opener.open
+
+        parts = [
+            (start, min(start + _RANGE_PART_SIZE, size) - 1)
+            for start in range(0, size, _RANGE_PART_SIZE)
+        ]
+
+        shared_progress = progress_reporter is not None
+        if not shared_progress:
+            blob_name = digest[:12] + "..." if len(digest) > 12 else digest
+            progress_reporter = ProgressReporter(size, f"Layer {blob_name}")
+
+        temp_data = tempfile.NamedTemporaryFile(delete=False, dir=output_dir)
+        path = temp_data.name
+        completed = False
+        futures = []
+        try:
+            _preallocate(temp_data, size)
+            temp_data.close()
+
+            logger.debug(
+                f"Downloading {digest[:19]} as {len(parts)} ranges of "
+                f"{self._format_bytes(_RANGE_PART_SIZE)}"
+            )
+
+            workers = min(_RANGE_WORKERS, len(parts))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_range,
+                        url,
+                        headers,
+                        path,
+                        start,
+                        end,
+                        progress_reporter,
+                        open_func,
+                    )
+                    for start, end in parts
+                ]
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            # Verify the reassembled blob against its digest
+            algorithm, _, expected_hash = digest.partition(":")
+            if algorithm in ("sha256", "sha512"):
+                hasher = hashlib.new(algorithm)
+                self._hash_file(path, hasher)
+                if hasher.hexdigest() != expected_hash:
+                    logger.error(
+                        f"Digest mismatch for blob {digest}: got {algorithm}:{hasher.hexdigest()}"
+                    )
+                    return None
+
+            completed = True
+            return path
+
+        except socket.timeout:
+            logger.error(
+                f"Download timeout for blob {digest}: "
+                f"Download chunk timeout after {self.chunk_timeout}s"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Ranged download error for blob {digest}: {e}")
+            return None
+        finally:
+            if not completed:
+                # Failed ranges took back their own bytes; take back the
+                # finished ones too, as the caller retries the whole blob
+                progress_reporter.rollback(
+                    sum(
+                        future.result()
+                        for future in futures
+                        if future.done()
+                        and not future.cancelled()
+                        and future.exception() is None
+                    )
+                )
+            if not shared_progress:
+                progress_reporter.finish()
+            temp_data.close()
+            if not completed:
+                self._remove_blob_file(path)
+
+    def _hash_file(self, path, hasher):
+        """Feed a file's content to a hasher through a read-only mapping.
+
+        hashlib reads the mapped pages directly, so the bytes are never
+        copied into Python objects. Falls back to chunked reads where the
+        file can't be mapped.
+
+        Args:
+            path (str): File to hash
+            hasher: hashlib object to update
+        """
+        with open(path, "rb") as f:
             try:
-                os.unlink(temp_data.name)
-            except OSError:
-                pass
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    hasher.update(chunk)
+                return
+
+            # Windowed slices of a memoryview don't copy, and keep each
+            # update bounded on 32-bit address spaces
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), _HASH_WINDOW):
+                    hasher.update(view[offset : offset + _HASH_WINDOW])
+
+    def _download_range(
+        self, url, headers, path, start, end, progress_reporter, open_func
+    ):
+        """Fetch one byte range of a blob into its place in the file.
+
+        Args:
+            url (str): Blob URL
+            headers (dict): Request headers to send
+            path (str): Preallocated blob file to write into
+            start (int): First byte offset (inclusive)
+            end (int): Last byte offset (inclusive)
+            progress_reporter (ProgressReporter): Reporter to feed
+            open_func (callable): Opener to send the request through
+
+        Returns:
+            int: Bytes written (and reported)
+
+        Raises:
+            ValueError: If the server ignored the range or returned a short part
+        """
+        req = Request(url, headers=dict(headers, Range=f"bytes={start}-{end}"))
+        sink = None
+        try:
+            with self._open_with_retry(open_func, req, self.chunk_timeout) as response:
+                if response.status != 206:
+                    raise ValueError(f"server ignored Range (HTTP {response.status})")
+
+                with open(path, "r+b") as f:
+                    f.seek(start)
+                    sink = ProgressWriter(f, progress_reporter)
+                    shutil.copyfileobj(response, sink, self.chunk_size)
+
+                # An overlong part is caught here too, or by the final digest
+                # check if it overwrote the next part first
+                if sink.written != end - start + 1:
+                    raise ValueError(
+                        f"range {start}-{end} returned {sink.written} bytes"
+                    )
+        except BaseException:
+            # The blob will be fetched again, so these bytes must not count
+            if sink is not None:
+                progress_reporter.rollback(sink.written)
+            raise
+
+        return sink.written
+
+    def _read_small_blob(
+        self, response, digest, expected_size, hasher=None, progress_reporter=None
+    ):
+        """Read a small blob of known size straight into memory.
+
+        Fills a preallocated buffer with readinto, avoiding the temporary
+        file (open, write, close, unlink) a disk-backed download costs.
+
+        Args:
+            response: HTTP response object to read from
+            digest (str): Blob digest (e.g., 'sha256:...') to verify against
+            expected_size (int): Content-Length of the blob
+            hasher (optional): hashlib object for digest verification
+            progress_reporter (ProgressReporter, optional): Reporter to feed
+
+        Returns:
+            bytes: Blob content, or None if the read failed, came up short or
+                did not match its digest
+        """
+        buf = bytearray(expected_size)
+        view = memoryview(buf)
+        offset = 0
+
+        try:
+            while offset < expected_size:
+                n = response.readinto(view[offset:])
+                if not n:
+                    break
+                offset += n
+                if progress_reporter:
+                    progress_reporter.update(n)
+        except socket.timeout:
+            logger.error(
+                f"Download timeout for blob {digest}: "
+                f"Download chunk timeout after {self.chunk_timeout}s"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Streaming error for blob {digest}: {e}")
+            return None
+        finally:
+            view.release()
+
+        if offset != expected_size:
+            logger.error(
+                f"Short read for blob {digest}: got {offset} of {expected_size} bytes"
+            )
+            return None
+
+        if hasher:
+            hasher.update(buf)
+            if hasher.hexdigest() != digest.partition(":")[2]:
+                logger.error(
+                    f"Digest mismatch for blob {digest}: got {hasher.name}:{hasher.hexdigest()}"
+                )
+                return None
+
+        return bytes(buf)
+
+    def _remove_blob_file(self, path):
+        """Remove a downloaded blob file, ignoring files that are already gone"""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
     def should_bypass_proxy(self, hostname):
         """Check if hostname should bypass proxy - delegated to ProxyManager"""
         return self.proxy_manager.should_bypass_proxy(hostname)
 
-    def make_request(self, url, headers=None):
+    def make_request(self, url, headers=None, method=None):
         """Make HTTP request with proxy handling"""
         req_headers = headers or {}
 
-        logger.debug(f"Request URL: {self.sanitize_debug_output(url)}")
-        logger.debug(f"Headers: {self.sanitize_debug_output(req_headers)}")
+        # Masking scans the text with regexes; only pay for it when the
+        # message will actually be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request URL: %s", self.proxy_manager.sanitize_debug_output(url)
+            )
+            logger.debug(
+                "Headers: %s", self.proxy_manager.sanitize_debug_output(req_headers)
+            )
 
-        # Check if we should bypass proxy for this URL
+        # Pick the prebuilt opener; no process-wide state is touched, so
+        # this is safe from download threads
         parsed_url = urlparse(url)
         if self.should_bypass_proxy(parsed_url.hostname):
-            logger.debug(f"Bypassing proxy for {parsed_url.hostname}")
-            # Temporarily disable proxy for this request
-            old_proxies = {}
-            for proxy_var in ["HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"]:
-                if proxy_var in os.environ:
-                    old_proxies[proxy_var] = os.environ[proxy_var]
-                    del os.environ[proxy_var]
+            logger.debug("Bypassing proxy for %s", parsed_url.hostname)
+            opener = self.proxy_manager.direct_opener
+        else:
+            opener = self.proxy_manager.proxy_opener
+
+        req = Request(url, headers=req_headers, method=method)
+        response = self._open_with_retry(opener.open, req, self.request_timeout)
+        logger.debug("Response code: %s", response.code)
+        return response
 
+    def _open_with_retry(self, open_func, req, timeout):
+        """Open a request, retrying transient 502/503/504 responses.
+
+        Retries up to _RETRY_ATTEMPTS times with exponential backoff
+        (0.3s, 0.6s, 1.2s); any other error is raised immediately.
+
+        Args:
+            open_func: An OpenerDirector's open method
+            req (Request): Request to open
+            timeout (float): Socket timeout in seconds
+
+        Returns:
+            HTTP response object
+        """
+        for attempt in range(_RETRY_ATTEMPTS + 1):
             try:
-                req = Request(url, headers=req_headers)
-                response = urlopen(req, timeout=self.request_timeout)
-                logger.debug(f"Response code: {response.code}")
-                return response
-            finally:
-                # Restore proxy settings
-                for proxy_var, value in old_proxies.items():
-                    os.environ[proxy_var] = value
-        else:
-            req = Request(url, headers=req_headers)
-            response = urlopen(req, timeout=self.request_timeout)
-            logger.debug(f"Response code: {response.code}")
-            return response
+                return open_func(req, timeout=timeout)
+            except HTTPError as e:
+                if e.code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+                    raise
+                e.close()
+                delay = _RETRY_BACKOFF * (2**attempt)
+                logger.debug(
+                    "HTTP %s from %s, retrying in %.1fs", e.code, req.full_url, delay
+                )
+                time.sleep(delay)
 
     def get_auth_token(self, image_name):
         """Get authentication token for Docker Hub"""
@@ -781,20 +1894,17 @@ class DockerImagePuller:
 
         try:
             with self.make_request(url) as response:
-                data = json.loads(response.read())
+                data = json.load(response)
                 return data.get("token")
         except (HTTPError, URLError) as e:
-            logger.error(f"Error getting auth token: {e}")
             logger.info(
                 "If using a corporate proxy, verify proxy configuration is correct"
             )
-            sys.exit(1)
+            raise PullError(f"Error getting auth token: {e}") from e
         except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Error parsing auth token response: {e}")
-            sys.exit(1)
+            raise PullError(f"Error parsing auth token response: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error getting auth token: {e}")
-            sys.exit(1)
+            raise PullError(f"Unexpected error getting auth token: {e}") from e
 
     def get_manifest(
         self, image_name, tag, token, architecture="amd64", os_type="linux"
@@ -805,157 +1915,238 @@ class DockerImagePuller:
         # First, try to get manifest list (for multi-arch images)
         headers = {
             "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.docker.distribution.manifest.list.v2+json,application/vnd.docker.distribution.manifest.v2+json,application/vnd.oci.image.index.v1+json,application/vnd.oci.image.manifest.v1+json",
+            "Accept": _MANIFEST_LIST_ACCEPT,
         }
 
         try:
-            with self.make_request(url, headers) as response:
-                manifest_data = json.loads(response.read())
+            index_key = (self.registry_url, image_name, tag)
+            manifest_data = self._index_cache.get(index_key)
+            if manifest_data is None:
+                cache_path = self._manifest_cache_path(f"{image_name}:{tag}")
+                manifest_data = self._fetch_manifest(url, headers, cache_path)
+                if "manifests" in manifest_data:
+                    self._index_cache[index_key] = manifest_data
+            else:
+                logger.debug("Reusing manifest index for %s:%s", image_name, tag)
+
+            # Check if this is a manifest list (multi-arch)
+            if "manifests" in manifest_data:
+                logger.info("Multi-architecture image detected. Available platforms:")
+
+                # List available platforms, indexing them as we go so
+                # selection below is a dict lookup instead of rescans.
+                # (os, arch) maps to the first entry regardless of
+                # variant; (os, arch, variant) to the exact variant
+                valid_manifests = []
+                platform_index = {}
+                for m in manifest_data["manifests"]:
+                    platform = m.get("platform", {})
+                    arch = platform.get("architecture", "unknown")
+                    os = platform.get("os", "unknown")
+                    variant = platform.get("variant", "")
+
+                    # Skip invalid entries
+                    if arch == "unknown" or os == "unknown":
+                        continue
+
+                    valid_manifests.append(m)
+                    platform_index.setdefault((os, arch), m)
+                    platform_index.setdefault((os, arch, variant), m)
+                    variant_str = f"-{variant}" if variant else ""
+                    logger.info(f"  - {os}/{arch}{variant_str}")
+
+                # Find matching manifest for requested architecture
+                selected_manifest = platform_index.get((os_type, architecture))
+
+                # Older images publish 64-bit ARM as arm/v8
+                if not selected_manifest and architecture == "arm64":
+                    selected_manifest = platform_index.get((os_type, "arm", "v8"))
+
+                if not selected_manifest and valid_manifests:
+                    # Fallback to first available platform
+                    logger.warning(f"No exact match for {os_type}/{architecture}")
+                    logger.info("Using first available platform as fallback")
+                    selected_manifest = valid_manifests[0]
+                    platform = selected_manifest.get("platform", {})
+                    logger.info(
+                        f"Using: {platform.get('os')}/{platform.get('architecture')}"
+                    )
+
+                if not selected_manifest:
+                    raise PullError("No valid manifest found")
+
+                platform = selected_manifest.get("platform", {})
+                logger.info(
+                    f"Selected platform: {platform.get('os')}/{platform.get('architecture')}"
+                )
+
+                # Now fetch the specific manifest using its digest
+                specific_digest = selected_manifest["digest"]
+                url = f"{self.registry_url}/v2/{image_name}/manifests/{specific_digest}"
+
+                headers = {
+                    "Authorization": f"Bearer {token}",
+                    "Accept": _MANIFEST_ACCEPT,
+                }
+
+                # Manifests fetched by digest never change, so a cached
+                # copy is used without asking the registry
+                specific_manifest = self._fetch_manifest(
+                    url,
+                    headers,
+                    self._manifest_cache_path(specific_digest),
+                    specific_digest,
+                )
+
+                # Check if we got an OCI manifest and convert if needed
+                if "mediaType" in specific_manifest and "oci" in specific_manifest.get(
+                    "mediaType", ""
+                ):
+                    logger.info("  (OCI format image)")
+
+                return specific_manifest
+
+            # It's already a regular manifest
+            elif "config" in manifest_data:
+                return manifest_data
 
-                # Check if this is a manifest list (multi-arch)
-                if "manifests" in manifest_data:
-                    logger.info(
-                        "Multi-architecture image detected. Available platforms:"
-                    )
+            # OCI format manifest
+            elif "mediaType" in manifest_data:
+                return manifest_data
 
-                    # List available platforms
-                    valid_manifests = []
-                    for m in manifest_data["manifests"]:
-                        platform = m.get("platform", {})
-                        arch = platform.get("architecture", "unknown")
-                        os = platform.get("os", "unknown")
-                        variant = platform.get("variant", "")
+            # Older schema v1 manifest (deprecated but might still exist)
+            elif (
+                "schemaVersion" in manifest_data and manifest_data["schemaVersion"] == 1
+            ):
+                logger.warning("Image uses deprecated manifest schema v1")
+                logger.warning(
+                    "This format is not fully supported. Image may not load correctly."
+                )
+                # Try to convert v1 to v2-like structure
+                return self.convert_schema_v1(manifest_data)
 
-                        # Skip invalid entries
-                        if arch == "unknown" or os == "unknown":
-                            continue
+            else:
+                logger.error(
+                    "Manifest content: %s",
+                    json.dumps(manifest_data, indent=2)[:500],
+                )
+                raise PullError(
+                    f"Unknown manifest format. Keys found: {list(manifest_data.keys())}"
+                )
 
-                        valid_manifests.append(m)
-                        variant_str = f"-{variant}" if variant else ""
-                        logger.info(f"  - {os}/{arch}{variant_str}")
+        except PullError:
+            raise
+        except HTTPError as e:
+            if e.code == 404:
+                raise PullError(f"Image {image_name}:{tag} not found") from e
+            try:
+                error_body = e.read().decode("utf-8")
+                if error_body:
+                    logger.error("Error details: %s", error_body)
+            except (UnicodeDecodeError, AttributeError):
+                pass
+            raise PullError(f"Error getting manifest: {e}") from e
+        except (json.JSONDecodeError, KeyError) as e:
+            raise PullError(f"Error parsing manifest response: {e}") from e
+        except Exception as e:
+            logger.debug("Exception traceback:", exc_info=True)
+            raise PullError(f"Unexpected error getting manifest: {e}") from e
 
-                    # Find matching manifest for requested architecture
-                    selected_manifest = None
+    def _manifest_cache_path(self, reference):
+        """Get the cache file for a manifest reference.
 
-                    # First try exact match
-                    for m in valid_manifests:
-                        platform = m.get("platform", {})
-                        if (
-                            platform.get("architecture") == architecture
-                            and platform.get("os") == os_type
-                        ):
-                            selected_manifest = m
-                            break
-
-                    # If no exact match and looking for arm, try variants
-                    if not selected_manifest and architecture in ["arm", "arm64"]:
-                        for m in valid_manifests:
-                            platform = m.get("platform", {})
-                            p_arch = platform.get("architecture", "")
-                            p_os = platform.get("os", "")
-                            p_variant = platform.get("variant", "")
-
-                            # Match arm variants
-                            if p_os == os_type:
-                                if architecture == "arm64" and (
-                                    p_arch == "arm64"
-                                    or (p_arch == "arm" and p_variant == "v8")
-                                ):
-                                    selected_manifest = m
-                                    break
-                                elif architecture == "arm" and p_arch == "arm":
-                                    selected_manifest = m
-                                    break
-
-                    if not selected_manifest and valid_manifests:
-                        # Fallback to first available platform
-                        logger.warning(f"No exact match for {os_type}/{architecture}")
-                        logger.info("Using first available platform as fallback")
-                        selected_manifest = valid_manifests[0]
-                        platform = selected_manifest.get("platform", {})
-                        logger.info(
-                            f"Using: {platform.get('os')}/{platform.get('architecture')}"
-                        )
+        Args:
+            reference (str): "image:tag" or a manifest digest
 
-                    if not selected_manifest:
-                        logger.error("No valid manifest found")
-                        sys.exit(1)
+        Returns:
+            str: Cache file path, or None if the manifest cache is disabled
+        """
+        cache_dir = self.config.manifest_cache_dir
+        if not cache_dir:
+            return None
+        key = hashlib.sha256(f"{self.registry_url}/{reference}".encode()).hexdigest()
+        return os.path.join(cache_dir, f"{key}.json")
 
-                    platform = selected_manifest.get("platform", {})
-                    logger.info(
-                        f"Selected platform: {platform.get('os')}/{platform.get('architecture')}"
-                    )
+    def _fetch_manifest(self, url, headers, cache_path=None, digest=None):
+        """Fetch a manifest, reusing a cached copy when it is still current.
 
-                    # Now fetch the specific manifest using its digest
-                    specific_digest = selected_manifest["digest"]
-                    url = f"{self.registry_url}/v2/{image_name}/manifests/{specific_digest}"
+        Tag references are revalidated with a HEAD request: if the
+        registry's Docker-Content-Digest matches the cached one (or it
+        answers 304 to If-None-Match) the cached manifest is returned and
+        the GET is skipped. Digest references are returned straight from
+        the cache.
 
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.docker.distribution.manifest.v2+json,application/vnd.oci.image.manifest.v1+json",
-                    }
+        Args:
+            url (str): Manifest URL
+            headers (dict): Request headers (authorization and Accept)
+            cache_path (str, optional): Cache file from _manifest_cache_path
+            digest (str, optional): Expected digest for digest references
 
-                    with self.make_request(url, headers) as response:
-                        specific_manifest = json.loads(response.read())
+        Returns:
+            dict: Parsed manifest
 
-                        # Check if we got an OCI manifest and convert if needed
-                        if (
-                            "mediaType" in specific_manifest
-                            and "oci" in specific_manifest.get("mediaType", "")
-                        ):
-                            logger.info("  (OCI format image)")
+        Raises:
+            HTTPError: If the manifest GET fails
+        """
+        cached = None
+        if cache_path:
+            try:
+                with open(cache_path, "rb") as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = None
 
-                        return specific_manifest
+        if cached and (not digest or cached.get("digest") == digest):
+            if digest:
+                return cached["manifest"]
 
-                # It's already a regular manifest
-                elif "config" in manifest_data:
-                    return manifest_data
+            current = None
+            try:
+                revalidate = dict(headers, **{"If-None-Match": f'"{cached["digest"]}"'})
+                with self.make_request(url, revalidate, method="HEAD") as response:
+                    current = response.headers.get("Docker-Content-Digest")
+            except HTTPError as e:
+                if e.code == 304:
+                    current = cached["digest"]
+            except (URLError, OSError):
+                pass
 
-                # OCI format manifest
-                elif "mediaType" in manifest_data:
-                    return manifest_data
+            if current == cached["digest"]:
+                logger.debug("Manifest %s unchanged, using cached copy", current)
+                return cached["manifest"]
+
+        with self.make_request(url, headers) as response:
+            # Without a cache the raw bytes aren't needed for hashing
+            if not cache_path:
+                return json.load(response)
+            raw = response.read()
+            served_digest = response.headers.get("Docker-Content-Digest")
+        manifest = json.loads(raw)
+
+        # Only cache bytes that match the digest they are filed under
+        actual = "sha256:" + hashlib.sha256(raw).hexdigest()
+        if (digest or served_digest or actual) == actual:
+            self._write_manifest_cache(
+                cache_path, {"digest": actual, "manifest": manifest}
+            )
 
-                # Older schema v1 manifest (deprecated but might still exist)
-                elif (
-                    "schemaVersion" in manifest_data
-                    and manifest_data["schemaVersion"] == 1
-                ):
-                    logger.warning("Image uses deprecated manifest schema v1")
-                    logger.warning(
-                        "This format is not fully supported. Image may not load correctly."
-                    )
-                    # Try to convert v1 to v2-like structure
-                    return self.convert_schema_v1(manifest_data)
+        return manifest
 
-                else:
-                    logger.error(
-                        f"Unknown manifest format. Keys found: {list(manifest_data.keys())}"
-                    )
-                    logger.error(
-                        "Manifest content: %s",
-                        json.dumps(manifest_data, indent=2)[:500],
-                    )
-                    sys.exit(1)
+    def _write_manifest_cache(self, cache_path, entry):
+        """Atomically write a manifest cache entry, ignoring failures.
 
-        except HTTPError as e:
-            if e.code == 404:
-                logger.error(f"Image {image_name}:{tag} not found")
-            else:
-                logger.error(f"Error getting manifest: {e}")
-                try:
-                    error_body = e.read().decode("utf-8")
-                    if error_body:
-                        logger.error("Error details: %s", error_body)
-                except (UnicodeDecodeError, AttributeError):
-                    pass
-            sys.exit(1)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Error parsing manifest response: {e}")
-            sys.exit(1)
-        except Exception as e:
-            logger.error(f"Unexpected error getting manifest: {e}")
-            traceback.print_exc()
-            sys.exit(1)
+        Args:
+            cache_path (str): Cache file path
+            entry (dict): Digest and manifest to store
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(entry))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write manifest cache %s: %s", cache_path, e)
 
     def convert_schema_v1(self, v1_manifest):
         """Attempt to convert schema v1 manifest to v2-like structure"""
@@ -963,16 +2154,14 @@ class DockerImagePuller:
         logger.info("Converting v1 manifest to v2 format...")
 
         # Extract layer digests from v1 fsLayers
-        layers = []
-        if "fsLayers" in v1_manifest:
-            for fs_layer in v1_manifest["fsLayers"]:
-                layers.append(
-                    {
-                        "digest": fs_layer.get("blobSum", ""),
-                        "size": 0,  # v1 doesn't include size
-                        "mediaType": "application/vnd.docker.image.rootfs.diff.tar.gzip",
-                    }
-                )
+        layers = [
+            {
+                "digest": fs_layer.get("blobSum", ""),
+                "size": 0,  # v1 doesn't include size
+                "mediaType": "application/vnd.docker.image.rootfs.diff.tar.gzip",
+            }
+            for fs_layer in v1_manifest.get("fsLayers", [])
+        ]
 
         # Create a minimal v2-like structure
         # Note: v1 doesn't have a separate config blob
@@ -986,7 +2175,83 @@ class DockerImagePuller:
             "layers": layers,
         }
 
-    def download_blob(self, image_name, digest, token, retry_with_new_token=True):
+    def _probe_blob(self, url, headers):
+        """Probe a blob with HEAD to learn how it will be served.
+
+        Args:
+            url (str): Registry blob URL
+            headers (dict): Request headers including authorization
+
+        Returns:
+            dict: "cdn" (redirected to S3/CloudFront, so the proxy can be
+                bypassed), "ranges" (byte ranges supported), "url" (final
+                URL after redirects) and "size" (Content-Length or None);
+                None if the probe failed
+        """
+        probe = {"cdn": False, "ranges": False, "url": url, "size": None}
+
+        try:
+            head_req = Request(url, headers=headers, method="HEAD")
+
+            # Use this puller's opener (honouring no_proxy), not whichever
+            # one was last installed process-wide
+            if self.should_bypass_proxy(urlparse(url).hostname):
+                opener = self.proxy_manager.direct_opener
+            else:
+                opener = self.proxy_manager.proxy_opener
+
+            try:
+                with self._open_with_retry(
+                    opener.open, head_req, self.request_timeout
+                ) as head_response:
+                    content_length = head_response.headers.get("Content-Length")
+                    if content_length and content_length.isdigit():
+                        probe["size"] = int(content_length)
+                    probe["ranges"] = (
+                        head_response.headers.get("Accept-Ranges", "").lower()
+                        == "bytes"
+                    )
+
+                    # Check if we got redirected to a CDN
+                    final_url = head_response.geturl()
+                    probe["url"] = final_url
+                    if final_url != url:
+                        # We got redirected, check if it's to S3/CDN
+                        if (
+                            "amazonaws.com" in final_url
+                            or "cloudfront.net" in final_url
+                        ):
+                            probe["cdn"] = True
+                            logger.debug(
+                                "Will bypass proxy for CDN URL: %s...", final_url[:100]
+                            )
+            except HTTPError as e:
+                # If we get a redirect status, extract the Location header
+                if e.code not in [301, 302, 303, 307, 308]:
+                    raise
+                location = e.headers.get("Location", "")
+                if "amazonaws.com" in location or "cloudfront.net" in location:
+                    probe["cdn"] = True
+                    logger.debug(
+                        "Will bypass proxy for CDN redirect: %s...", location[:100]
+                    )
+        except (HTTPError, URLError, OSError, socket.timeout):
+            # HEAD request failed, continue with GET
+            return None
+
+        return probe
+
+    def download_blob(
+        self,
+        image_name,
+        digest,
+        token,
+        retry_with_new_token=True,
+        progress_reporter=None,
+        decompress=False,
+        output_dir=None,
+        size=None,
+    ):
         """Download a blob (layer) from Docker registry.
 
         Handles authentication, redirects, and CDN optimization.
@@ -997,9 +2262,18 @@ class DockerImagePuller:
             digest (str): SHA256 digest of the blob to download
             token (str): Bearer token for authentication
             retry_with_new_token (bool): Retry once with fresh token on 401
+            progress_reporter (ProgressReporter, optional): Shared reporter
+                updated with downloaded bytes
+            decompress (bool): Gunzip compressed layers while downloading
+            output_dir (str, optional): Directory for the blob file
+                (defaults to the system temporary directory)
+            size (int, optional): Blob size from the manifest, used when the
+                HEAD probe is skipped
 
         Returns:
-            bytes: Blob data, or None if download failed
+            str or bytes: Path to the downloaded blob file (owned by the
+                caller), or the content of a small blob; None if download
+                failed
 
         Raises:
             Various network and HTTP errors are caught and logged
@@ -1008,7 +2282,7 @@ class DockerImagePuller:
 
         headers = {
             "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.docker.image.rootfs.diff.tar.gzip,application/octet-stream,*/*",
+            "Accept": _BLOB_ACCEPT,
         }
 
         try:
@@ -1016,85 +2290,97 @@ class DockerImagePuller:
             # and auth headers will be stripped by our custom redirect handler
             req = Request(url, headers=headers)
 
-            logger.debug(f"Downloading blob from: {url}")
-
-            # For blob downloads, temporarily bypass proxy for CDN URLs
-            # Save current proxy settings
-            old_proxies = {}
-            bypass_proxy_for_cdn = False
-
-            try:
-                # First, make a HEAD request to see if we'll be redirected to a CDN
-                head_req = Request(url, headers=headers)
-                head_req.get_method = lambda: "HEAD"
+            logger.debug("Downloading blob from: %s", url)
+
+            # Every blob of an image is served the same way, so only the
+            # first download probes with HEAD; later ones reuse the answer
+            # and take the size from the manifest
+            blob_url, blob_size = url, size
+            probe_key = (self.registry_url, image_name)
+            probe = self._blob_probe_cache.get(probe_key)
+            if probe is None:
+                probe = self._probe_blob(url, headers)
+                if probe is not None:
+                    blob_url = probe.pop("url")
+                    blob_size = probe.pop("size") or size
+                    self._blob_probe_cache[probe_key] = probe
+            else:
+                logger.debug("Reusing blob probe result for %s", image_name)
 
-                try:
-                    with urlopen(
-                        head_req, timeout=self.request_timeout
-                    ) as head_response:
-                        # Check if we got redirected to a CDN
-                        final_url = head_response.geturl()
-                        if final_url != url:
-                            # We got redirected, check if it's to S3/CDN
-                            if (
-                                "amazonaws.com" in final_url
-                                or "cloudfront.net" in final_url
-                            ):
-                                bypass_proxy_for_cdn = True
-                                logger.debug(
-                                    f"Will bypass proxy for CDN URL: {final_url[:100]}..."
-                                )
-                except HTTPError as e:
-                    # If we get a redirect status, extract the Location header
-                    if e.code in [301, 302, 303, 307, 308]:
-                        location = e.headers.get("Location", "")
-                        if "amazonaws.com" in location or "cloudfront.net" in location:
-                            bypass_proxy_for_cdn = True
-                            logger.debug(
-                                f"Will bypass proxy for CDN redirect: {location[:100]}..."
-                            )
-            except (HTTPError, URLError, OSError, socket.timeout):
-                # HEAD request failed, continue with GET
-                pass
+            bypass_proxy_for_cdn = bool(probe and probe["cdn"])
+            accepts_ranges = bool(probe and probe["ranges"])
 
-            # If we need to bypass proxy for CDN, temporarily disable it
+            # CDN downloads go through the direct opener; choosing it per
+            # call leaves os.environ and the installed opener untouched, so
+            # concurrent downloads can't see each other's proxy settings
             if bypass_proxy_for_cdn:
-                for proxy_var in [
-                    "HTTP_PROXY",
-                    "HTTPS_PROXY",
-                    "http_proxy",
-                    "https_proxy",
-                ]:
-                    if proxy_var in os.environ:
-                        old_proxies[proxy_var] = os.environ[proxy_var]
-                        del os.environ[proxy_var]
-
-                # Reinstall opener without proxy
-                if self.proxy_config.get("insecure"):
-                    ctx = ssl.create_default_context()
-                    ctx.check_hostname = False
-                    ctx.verify_mode = ssl.CERT_NONE
-                    https_handler = urllib.request.HTTPSHandler(context=ctx)
-                    opener = build_opener(https_handler)
-                else:
-                    opener = build_opener()
-                install_opener(opener)
+                open_func = self.proxy_manager.direct_opener.open
+                logger.debug("Bypassing proxy for CDN download")
+            else:
+                open_func = self.proxy_manager.proxy_opener.open
+
+            # Large blobs on range-capable servers are split across streams
+            if accepts_ranges and blob_size and blob_size >= _RANGE_THRESHOLD:
+                # A redirect target (CDN) must not receive the registry token
+                range_headers = headers
+                if blob_url != url:
+                    range_headers = {
+                        k: v for k, v in headers.items() if k != "Authorization"
+                    }
+                blob_path = self._download_ranged(
+                    blob_url,
+                    range_headers,
+                    digest,
+                    blob_size,
+                    progress_reporter,
+                    output_dir,
+                    open_func,
+                )
+                if blob_path:
+                    return blob_path
+                logger.warning(
+                    f"Ranged download of {digest[:19]} failed, retrying as a single stream"
+                )
 
-                logger.debug("Temporarily disabled proxy for CDN download")
+            def resume(offset):
+                """Reopen the blob at offset; None if the server ignores Range"""
+                range_req = Request(
+                    url, headers=dict(headers, Range=f"bytes={offset}-")
+                )
+                resumed = self._open_with_retry(
+                    open_func, range_req, self.chunk_timeout
+                )
+                content_range = resumed.headers.get("Content-Range", "")
+                if resumed.status != 206 or not content_range.startswith(
+                    f"bytes {offset}-"
+                ):
+                    resumed.close()
+                    return None
+                return resumed
 
             # Now make the actual download request
-            with urlopen(req, timeout=self.download_timeout) as response:
+            # chunk_timeout bounds each socket read, so a stalled transfer
+            # raises socket.timeout instead of hanging
+            with self._open_with_retry(open_func, req, self.chunk_timeout) as response:
                 # Check if we got redirected
                 final_url = response.geturl()
                 if final_url != url:
-                    logger.debug(f"Followed redirect to: {final_url[:100]}...")
+                    logger.debug("Followed redirect to: %s...", final_url[:100])
 
                 # Get content length if available
                 content_length = response.headers.get("Content-Length")
                 expected_size = int(content_length) if content_length else None
 
                 # Use streaming download to prevent memory issues
-                return self._stream_download(response, digest, expected_size)
+                return self._stream_download(
+                    response,
+                    digest,
+                    expected_size,
+                    progress_reporter,
+                    decompress,
+                    output_dir,
+                    resume,
+                )
 
         except HTTPError as e:
             if e.code == 401 and retry_with_new_token:
@@ -1103,7 +2389,14 @@ class DockerImagePuller:
                 logger.info("Authorization failed, requesting new token...")
                 new_token = self.get_auth_token(image_name)
                 return self.download_blob(
-                    image_name, digest, new_token, retry_with_new_token=False
+                    image_name,
+                    digest,
+                    new_token,
+                    retry_with_new_token=False,
+                    progress_reporter=progress_reporter,
+                    decompress=decompress,
+                    output_dir=output_dir,
+                    size=size,
                 )
 
             logger.error(f"Error downloading blob {digest}: HTTP {e.code} - {e.reason}")
@@ -1116,7 +2409,11 @@ class DockerImagePuller:
             except (UnicodeDecodeError, AttributeError):
                 pass
 
-            logger.debug(f"Request headers were: {self.sanitize_debug_output(headers)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request headers were: %s",
+                    self.proxy_manager.sanitize_debug_output(headers),
+                )
 
             return None
 
@@ -1129,17 +2426,6 @@ class DockerImagePuller:
             logger.debug("Exception traceback:", exc_info=True)
             return None
 
-        finally:
-            # Restore proxy settings if we bypassed them
-            if bypass_proxy_for_cdn and old_proxies:
-                for proxy_var, value in old_proxies.items():
-                    os.environ[proxy_var] = value
-
-                # Reinstall the original opener with proxy
-                self.setup_proxy()
-
-                logger.debug("Restored proxy settings")
-
     def create_docker_tar(
         self,
         image_name,
@@ -1149,6 +2435,7 @@ class DockerImagePuller:
         layers,
         output_file,
         progress_reporter=None,
+        work_dir=None,
     ):
         """Create a Docker-compatible tar file from downloaded components.
 
@@ -1160,9 +2447,12 @@ class DockerImagePuller:
             tag (str): Image tag (e.g., 'latest')
             manifest (dict): Image manifest metadata
             config_blob (bytes): Image configuration blob
-            layers (list): List of layer dictionaries with digest, size, data
+            layers (list): List of layer dictionaries with digest, size and
+                either the path of the downloaded blob file or its data
             output_file (str): Path where to save the tar file
             progress_reporter (ProgressReporter, optional): Progress reporter for tar creation
+            work_dir (str, optional): Scratch directory for decompressing
+                layers; a private temporary directory is used if not given
 
         Creates:
             A tar file containing:
@@ -1182,9 +2472,7 @@ class DockerImagePuller:
         full_image_name = f"{namespace}/{repo}"
 
         # Calculate progress steps
-        total_steps = 4 + len(
-            layers
-        )  # manifest, config, repositories, tar creation + layers
+        total_steps = 4 + len(layers)  # manifest, config, layers, completion
         current_step = 0
 
         def update_progress(step_name="Processing"):
@@ -1197,124 +2485,240 @@ class DockerImagePuller:
                 progress_reporter.description = step_name
                 progress_reporter._display_progress()
 
-        # Create temporary directory for building tar
-        with tempfile.TemporaryDirectory() as tmpdir:
-            update_progress("Preparing config")
-
-            # Save config JSON
-            config_digest = manifest["config"]["digest"].replace("sha256:", "")
-            config_file = f"{config_digest}.json"
-            config_path = os.path.join(tmpdir, config_file)
-
-            with open(config_path, "wb") as f:
-                f.write(config_blob)
-
-            update_progress("Processing layers")
+        # Everything but the layer contents is known up front, so members are
+        # written straight into the tar instead of staged in a directory
+        config_digest = manifest["config"]["digest"].replace("sha256:", "")
+        config_file = f"{config_digest}.json"
+        layer_files = [
+            layer_info["digest"].replace("sha256:", "") for layer_info in layers
+        ]
 
-            # Save layers
-            layer_files = []
-            for i, layer_info in enumerate(layers):
-                layer_digest = layer_info["digest"].replace("sha256:", "")
-                layer_dir = os.path.join(tmpdir, layer_digest)
-                os.makedirs(layer_dir, exist_ok=True)
+        manifest_json = [
+            {
+                "Config": config_file,
+                "RepoTags": [f"{full_image_name}:{tag}"],
+                "Layers": [f"{lf}/layer.tar" for lf in layer_files],
+            }
+        ]
+        repositories = {full_image_name: {tag: layer_files[-1] if layer_files else ""}}
+        mtime = int(time.time())
+
+        # Per-layer json files differ only in their id
+        layer_json_template = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "container_config": {
+                "Hostname": "",
+                "Domainname": "",
+                "User": "",
+                "AttachStdin": False,
+                "AttachStdout": False,
+                "AttachStderr": False,
+                "Tty": False,
+                "OpenStdin": False,
+                "StdinOnce": False,
+                "Env": None,
+                "Cmd": None,
+                "Image": "",
+                "Volumes": None,
+                "WorkingDir": "",
+                "Entrypoint": None,
+                "OnBuild": None,
+                "Labels": None,
+            },
+        }
 
-                layer_tar_path = os.path.join(layer_dir, "layer.tar")
+        # Scratch space for decompressing layers, unless the caller provided it
+        own_dir = tempfile.TemporaryDirectory() if work_dir is None else None
+        tmpdir = work_dir if work_dir is not None else own_dir.name
+
+        # Layers that are still compressed (e.g. fetched as byte ranges) are
+        # gunzipped in parallel while earlier members are written; zlib
+        # releases the GIL while inflating
+        workers = max(1, min(os.cpu_count() or 1, len(layers)))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        layer_futures = [
+            executor.submit(self._open_layer_tar, layer_info, tmpdir)
+            for layer_info in layers
+        ]
+        try:
+            with tarfile.open(output_file, "w") as tar:
+                update_progress("Creating manifest")
+                self._add_tar_member(
+                    tar,
+                    "manifest.json",
+                    io.BytesIO(_json_dumps(manifest_json)),
+                    mtime,
+                )
 
-                # Check if layer data is gzipped and decompress if needed
-                layer_data = layer_info["data"]
-                if layer_data[:2] == b"\x1f\x8b":  # gzip magic number
-                    try:
-                        layer_data = gzip.decompress(layer_data)
-                    except (OSError, gzip.BadGzipFile):
-                        pass  # Not gzipped or error decompressing
-
-                with open(layer_tar_path, "wb") as f:
-                    f.write(layer_data)
-
-                # Create VERSION file
-                version_path = os.path.join(layer_dir, "VERSION")
-                with open(version_path, "w") as f:
-                    f.write("1.0")
-
-                # Create layer.json
-                layer_json_path = os.path.join(layer_dir, "json")
-                layer_json = {
-                    "id": layer_digest,
-                    "created": datetime.now(timezone.utc).isoformat(),
-                    "container_config": {
-                        "Hostname": "",
-                        "Domainname": "",
-                        "User": "",
-                        "AttachStdin": False,
-                        "AttachStdout": False,
-                        "AttachStderr": False,
-                        "Tty": False,
-                        "OpenStdin": False,
-                        "StdinOnce": False,
-                        "Env": None,
-                        "Cmd": None,
-                        "Image": "",
-                        "Volumes": None,
-                        "WorkingDir": "",
-                        "Entrypoint": None,
-                        "OnBuild": None,
-                        "Labels": None,
-                    },
-                }
+                update_progress("Preparing config")
+                self._add_tar_member(tar, config_file, io.BytesIO(config_blob), mtime)
+                self._add_tar_member(
+                    tar,
+                    "repositories",
+                    io.BytesIO(_json_dumps(repositories)),
+                    mtime,
+                )
 
-                with open(layer_json_path, "w") as f:
-                    json.dump(layer_json, f)
+                for i, layer_digest in enumerate(layer_files):
+                    with layer_futures[i].result() as layer_tar:
+                        self._add_tar_member(
+                            tar, f"{layer_digest}/layer.tar", layer_tar, mtime
+                        )
 
-                layer_files.append(layer_digest)
-                update_progress(f"Layer {i + 1}/{len(layers)}")
+                    self._add_tar_member(
+                        tar, f"{layer_digest}/VERSION", io.BytesIO(b"1.0"), mtime
+                    )
+                    self._add_tar_member(
+                        tar,
+                        f"{layer_digest}/json",
+                        io.BytesIO(
+                            _json_dumps({"id": layer_digest, **layer_json_template})
+                        ),
+                        mtime,
+                    )
 
-            update_progress("Creating manifest")
+                    update_progress(f"Layer {i + 1}/{len(layers)}")
 
-            # Create manifest.json
-            manifest_json = [
-                {
-                    "Config": config_file,
-                    "RepoTags": [f"{full_image_name}:{tag}"],
-                    "Layers": [f"{lf}/layer.tar" for lf in layer_files],
-                }
-            ]
+            update_progress("Completed")
+        finally:
+            for future in layer_futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # Close layer files left open by a failure part way through
+            for future in layer_futures:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+            if own_dir is not None:
+                own_dir.cleanup()
+
+    def _add_tar_member(self, tar, name, fileobj, mtime):
+        """Write a regular file member to the tar from an open file object.
+
+        Large members backed by a real file skip tarfile's Python copy loop:
+        the header is written through tarfile and the payload is copied
+        kernel-side with os.sendfile, falling back to copyfileobj where
+        sendfile is unavailable or refuses the file pair.
 
-            manifest_path = os.path.join(tmpdir, "manifest.json")
-            with open(manifest_path, "w") as f:
-                json.dump(manifest_json, f)
+        Args:
+            tar (tarfile.TarFile): Archive opened for writing
+            name (str): Member name inside the archive
+            fileobj: Readable binary file object positioned at the start
+            mtime (int): Modification time to record
+        """
+        info = tarfile.TarInfo(name)
+        info.size = fileobj.seek(0, os.SEEK_END)
+        info.mtime = mtime
+        fileobj.seek(0)
 
-            # Create repositories file
-            repositories = {
-                full_image_name: {tag: layer_files[-1] if layer_files else ""}
-            }
+        try:
+            use_sendfile = (
+                hasattr(os, "sendfile")
+                and info.size >= _SENDFILE_THRESHOLD
+                and tar.fileobj.seekable()
+            )
+            if use_sendfile:
+                src_fd = fileobj.fileno()
+                dst_fd = tar.fileobj.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            use_sendfile = False
+
+        if not use_sendfile:
+            tar.addfile(info, fileobj)
+            return
 
-            repositories_path = os.path.join(tmpdir, "repositories")
-            with open(repositories_path, "w") as f:
-                json.dump(repositories, f)
+        # Same bookkeeping as TarFile.addfile, minus the payload copy
+        header = info.tobuf(tar.format, tar.encoding, tar.errors)
+        tar.fileobj.write(header)
+        tar.offset += len(header)
+        tar.fileobj.flush()
 
-            update_progress("Building tar file")
+        offset = 0
+        try:
+            while offset < info.size:
+                sent = os.sendfile(dst_fd, src_fd, offset, info.size - offset)
+                if sent == 0:
+                    raise EOFError(f"{name} shrank while being archived")
+                offset += sent
+        except OSError:
+            # e.g. macOS only supports sockets as the destination
+            if offset:
+                raise
+            shutil.copyfileobj(fileobj, tar.fileobj, 1024 * 1024)
+        else:
+            # sendfile moved the descriptor; resync the buffered writer
+            tar.fileobj.seek(0, os.SEEK_END)
 
-            # Create the tar file
-            with tarfile.open(output_file, "w") as tar:
-                # Add manifest.json
-                tar.add(manifest_path, arcname="manifest.json")
+        blocks, remainder = divmod(info.size, tarfile.BLOCKSIZE)
+        if remainder:
+            tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            blocks += 1
+        tar.offset += blocks * tarfile.BLOCKSIZE
+        tar.members.append(info)
 
-                # Add config
-                tar.add(config_path, arcname=config_file)
+    def _open_layer_tar(self, layer_info, tmpdir):
+        """Open the uncompressed tar stream of a downloaded layer.
 
-                # Add repositories
-                tar.add(repositories_path, arcname="repositories")
+        The decoder is chosen from the layer mediaType. Uncompressed layers
+        are opened as they are; zstd and gzip blobs are decompressed into an
+        anonymous temporary file that disappears once closed. Gzip layers
+        may already have been gunzipped while downloading, so only those
+        (and layers without a mediaType) are checked for the magic number.
 
-                # Add each layer directory
-                for layer_digest in layer_files:
-                    layer_dir = os.path.join(tmpdir, layer_digest)
-                    for root, _dirs, files in os.walk(layer_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, tmpdir)
-                            tar.add(file_path, arcname=arcname)
+        Args:
+            layer_info (dict): Layer with either "path" or "data", and
+                optionally "mediaType"
+            tmpdir (str): Directory for the decompressed temporary file
 
-            update_progress("Completed")
+        Returns:
+            Readable binary file object for the layer tar
+        """
+        blob_data = layer_info.get("data")
+        if blob_data is not None:
+            src = io.BytesIO(blob_data)
+        else:
+            src = open(layer_info["path"], "rb")
+
+        media_type = layer_info.get("mediaType") or ""
+        if "zstd" in media_type:
+            if zstandard is None:
+                logger.warning(
+                    "zstd layer kept compressed (install the zstandard package "
+                    "to decompress it)"
+                )
+                return src
+            layer_tar = tempfile.TemporaryFile(dir=tmpdir)
+            try:
+                zstandard.ZstdDecompressor().copy_stream(
+                    src, layer_tar, write_size=1024 * 1024
+                )
+            except zstandard.ZstdError:
+                layer_tar.close()
+                src.seek(0)
+                return src
+            src.close()
+            return layer_tar
+
+        if media_type and "gzip" not in media_type:
+            return src
+
+        if src.read(2) != b"\x1f\x8b":  # gzip magic number
+            src.seek(0)
+            return src
+
+        src.seek(0)
+        layer_tar = tempfile.TemporaryFile(dir=tmpdir)
+        try:
+            sink = GunzipWriter(layer_tar, zlib_module=self.zlib_module)
+            shutil.copyfileobj(src, sink, 1024 * 1024)
+            sink.close()
+        except (OSError, EOFError, self.zlib_module.error):
+            # Not gzipped after all; ship the blob as-is
+            layer_tar.close()
+            src.seek(0)
+            return src
+
+        src.close()
+        return layer_tar
 
     def pull_image(
         self, image_spec, output_file=None, architecture="amd64", os_type="linux"
@@ -1326,14 +2730,12 @@ class DockerImagePuller:
             output_file (str, optional): Output tar filename
             architecture (str): Target architecture
             os_type (str): Target operating system
+
+        Raises:
+            PullError: If the image could not be pulled
         """
 
-        # Parse image specification
-        if ":" in image_spec:
-            image_name, tag = image_spec.rsplit(":", 1)
-        else:
-            image_name = image_spec
-            tag = "latest"
+        image_name, tag = self._parse_image_spec(image_spec)
 
         # Handle official images (prepend library/)
         if "/" not in image_name:
@@ -1358,120 +2760,308 @@ class DockerImagePuller:
         logger.info("Downloading image configuration...")
         config_digest = manifest.get("config", {}).get("digest")
         if not config_digest:
-            logger.error("No config digest found in manifest")
             logger.error("Manifest structure: %s", json.dumps(manifest, indent=2)[:500])
-            sys.exit(1)
+            raise PullError("No config digest found in manifest")
 
         config_blob = self.download_blob(full_image_name, config_digest, token)
 
         if not config_blob:
-            logger.error("Failed to download config")
-            sys.exit(1)
+            raise PullError("Failed to download config")
+
+        # Configs are normally small enough to arrive in memory; read the
+        # file and drop it if not
+        if isinstance(config_blob, str):
+            config_path = config_blob
+            with open(config_path, "rb") as f:
+                config_blob = f.read()
+            self._remove_blob_file(config_path)
+
+        # Downloaded blobs and decompression scratch files share one
+        # directory, removed in one go however the pull ends
+        with tempfile.TemporaryDirectory(prefix="docker_pull_") as work_dir:
+            # Download layers with overall progress tracking
+            layers = []
+            layer_list = manifest.get("layers", [])
+            total_layers = len(layer_list)
+
+            if total_layers == 0:
+                logger.warning("No layers found in manifest")
+                logger.error(
+                    "Manifest structure: %s", json.dumps(manifest, indent=2)[:500]
+                )
+            else:
+                # Calculate total download size for overall progress
+                total_download_size = sum(layer.get("size", 0) for layer in layer_list)
 
-        # Download layers with overall progress tracking
-        layers = []
-        layer_list = manifest.get("layers", [])
-        total_layers = len(layer_list)
+                logger.info(
+                    f"Downloading {total_layers} layers ({self._format_bytes(total_download_size)} total, "
+                    f"{self.max_concurrent_downloads} concurrent)..."
+                )
 
-        if total_layers == 0:
-            logger.warning("No layers found in manifest")
-            logger.error("Manifest structure: %s", json.dumps(manifest, indent=2)[:500])
-        else:
-            # Calculate total download size for overall progress
-            total_download_size = sum(layer.get("size", 0) for layer in layer_list)
+                # Show individual layer info up front; downloads run concurrently
+                for i, layer in enumerate(layer_list):
+                    digest = layer.get("digest")
+                    size = layer.get("size", 0)
+                    if digest:
+                        size_str = (
+                            f"{self._format_bytes(size)}" if size else "unknown size"
+                        )
+                        logger.info(
+                            f"Layer {i + 1}/{total_layers} ({digest[:12]}... {size_str})"
+                        )
 
-            logger.info(
-                f"Downloading {total_layers} layers ({self._format_bytes(total_download_size)} total)..."
+                # On a terminal draw one line per layer; otherwise fall back to
+                # the single overall line
+                renderer = MultiProgressRenderer() if sys.stdout.isatty() else None
+
+                # Create overall progress reporter, fed by every download thread
+                overall_progress = ProgressReporter(
+                    total_download_size if total_download_size > 0 else None,
+                    "Overall progress",
+                    show_speed=True,
+                    renderer=renderer,
+                )
+
+                if renderer:
+                    renderer.start(logging.getLogger().handlers)
+                try:
+                    blobs = self._download_layers(
+                        full_image_name,
+                        layer_list,
+                        token,
+                        overall_progress,
+                        output_dir=work_dir,
+                    )
+                finally:
+                    if renderer:
+                        renderer.close()
+
+                # Finish overall progress
+                overall_progress.finish()
+
+                for layer, blob in zip(layer_list, blobs):
+                    if blob:
+                        layers.append(
+                            {
+                                "digest": layer["digest"],
+                                "size": layer.get("size", 0),
+                                "mediaType": layer.get("mediaType"),
+                                "path" if isinstance(blob, str) else "data": blob,
+                            }
+                        )
+
+            if not layers:
+                raise PullError("No layers were successfully downloaded")
+
+            # Create Docker tar
+            logger.info(f"Creating tar file: {output_file}")
+
+            # Show tar creation progress for large images
+            tar_progress = ProgressReporter(
+                description="Creating tar", show_speed=False
             )
 
-            # Create overall progress reporter
-            overall_progress = ProgressReporter(
-                total_download_size if total_download_size > 0 else None,
-                "Overall progress",
-                show_speed=True,
+            self.create_docker_tar(
+                full_image_name,
+                tag,
+                manifest,
+                config_blob,
+                layers,
+                output_file,
+                tar_progress,
+                work_dir=work_dir,
             )
 
-            downloaded_size = 0
+            tar_progress.finish()
 
-        for i, layer in enumerate(layer_list):
-            digest = layer.get("digest")
-            size = layer.get("size", 0)
+        # Calculate final size
+        file_size = os.path.getsize(output_file)
+        logger.info(
+            f"Successfully created {output_file} (size: {self._format_bytes(file_size)})"
+        )
+        logger.info(f"To load this image, run: docker load -i {output_file}")
 
-            if not digest:
-                logger.warning(f"Layer {i + 1} missing digest, skipping")
-                continue
+    def pull_images_multiarch(self, image_spec, architectures, os_type="linux"):
+        """Pull one image for several architectures.
 
-            size_str = f"{self._format_bytes(size)}" if size else "unknown size"
-            layer_desc = f"Layer {i + 1}/{total_layers}"
+        The tag's manifest index is fetched once and reused for every
+        architecture. Each image is saved as imagename_tag_arch.tar.
 
-            # Show individual layer info
-            logger.info(f"{layer_desc} ({digest[:12]}... {size_str})")
+        Args:
+            image_spec (str): Image specification (name:tag)
+            architectures (list): Target architectures (e.g., ['amd64', 'arm64'])
+            os_type (str): Target operating system
 
-            blob_data = self.download_blob(full_image_name, digest, token)
+        Returns:
+            list: Architectures that failed to pull
+        """
+        image_name, tag = self._parse_image_spec(image_spec)
+        safe_name = image_name.replace("/", "_")
 
-            if not blob_data:
-                logger.error(f"Failed to download layer {digest}")
-                logger.info("Continuing with remaining layers")
-                continue
+        failed = []
+        for architecture in architectures:
+            try:
+                self.pull_image(
+                    image_spec,
+                    f"{safe_name}_{tag}_{architecture}.tar",
+                    architecture=architecture,
+                    os_type=os_type,
+                )
+            except (PullError, HTTPError, URLError, OSError) as e:
+                logger.error(f"Failed to pull {image_spec} for {architecture}: {e}")
+                failed.append(architecture)
 
-            # Update overall progress
-            if total_layers > 0:
-                downloaded_size += len(blob_data)
-                overall_progress.downloaded = downloaded_size
-                overall_progress._display_progress()
+        if failed:
+            logger.error(
+                f"{len(failed)} of {len(architectures)} architectures failed to pull"
+            )
+        return failed
 
-            layers.append({"digest": digest, "size": size, "data": blob_data})
+    def pull_images(self, image_specs, architecture="amd64", os_type="linux"):
+        """Pull several images in turn, each saved under its default name.
 
-        # Finish overall progress
-        if total_layers > 0:
-            overall_progress.finish()
+        The puller's connection pool, auth state and blob probe cache are
+        reused across images. A failed image is logged and skipped.
 
-        if not layers:
-            logger.error("No layers were successfully downloaded")
-            sys.exit(1)
+        Args:
+            image_specs (list): Image specifications (name:tag)
+            architecture (str): Target architecture
+            os_type (str): Target operating system
 
-        # Create Docker tar
-        logger.info(f"Creating tar file: {output_file}")
+        Returns:
+            list: Image specifications that failed to pull
+        """
+        failed = []
+        for image_spec in image_specs:
+            try:
+                self.pull_image(image_spec, architecture=architecture, os_type=os_type)
+            except (PullError, HTTPError, URLError, OSError) as e:
+                logger.error(f"Failed to pull {image_spec}: {e}")
+                failed.append(image_spec)
 
-        # Show tar creation progress for large images
-        tar_progress = ProgressReporter(description="Creating tar", show_speed=False)
+        if failed:
+            logger.error(f"{len(failed)} of {len(image_specs)} images failed to pull")
+        return failed
 
-        self.create_docker_tar(
-            full_image_name,
-            tag,
-            manifest,
-            config_blob,
-            layers,
-            output_file,
-            tar_progress,
-        )
+    def _parse_image_spec(self, image_spec):
+        """Split an image specification into name and tag.
 
-        tar_progress.finish()
+        Args:
+            image_spec (str): Image specification (name[:tag])
 
-        # Calculate final size
-        file_size = os.path.getsize(output_file)
-        logger.info(
-            f"Successfully created {output_file} (size: {self._format_bytes(file_size)})"
-        )
-        logger.info(f"To load this image, run: docker load -i {output_file}")
+        Returns:
+            tuple: (image_name, tag), with tag defaulting to 'latest'
+        """
+        image_name, sep, tag = image_spec.rpartition(":")
+        # A "/" after the last colon means it was a registry port
+        # (myregistry.com:5000/app), not a tag
+        if not sep or "/" in tag:
+            return image_spec, "latest"
+        return image_name, tag
+
+    def _download_layers(
+        self, image_name, layer_list, token, progress_reporter=None, output_dir=None
+    ):
+        """Download layer blobs concurrently, preserving manifest order.
+
+        Uses a bounded thread pool (max_concurrent_downloads workers) so
+        several layers are in flight at once, like dockerd's sliding window.
+
+        Args:
+            image_name (str): Repository name (e.g., 'library/alpine')
+            layer_list (list): Layer descriptors from the image manifest
+            token (str): Bearer token for authentication
+            progress_reporter (ProgressReporter, optional): Shared reporter
+                aggregating bytes across all downloads
+            output_dir (str, optional): Directory to write blob files into
+
+        Returns:
+            list: Path of each (decompressed) layer tar, or the content of
+                small layers, in manifest order; None for failures
+        """
+        results = [None] * len(layer_list)
+        max_workers = max(1, min(self.max_concurrent_downloads, len(layer_list)))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {}
+            for i, layer in enumerate(layer_list):
+                digest = layer.get("digest")
+                if not digest:
+                    logger.warning(f"Layer {i + 1} missing digest, skipping")
+                    continue
+
+                future = executor.submit(
+                    self._download_layer,
+                    image_name,
+                    layer,
+                    token,
+                    progress_reporter,
+                    output_dir,
+                )
+                future_to_index[future] = i
+
+            try:
+                for future in concurrent.futures.as_completed(future_to_index):
+                    i = future_to_index[future]
+                    results[i] = future.result()
+                    if not results[i]:
+                        logger.error(
+                            f"Failed to download layer {layer_list[i]['digest']}"
+                        )
+                        logger.info("Continuing with remaining layers")
+            except BaseException:
+                # Don't start queued downloads once we are bailing out
+                for future in future_to_index:
+                    future.cancel()
+                raise
+
+        return results
+
+    def _download_layer(
+        self, image_name, layer, token, progress_reporter=None, output_dir=None
+    ):
+        """Download one layer blob on a _download_layers worker thread.
 
-    def _format_bytes(self, size):
-        """Format bytes into human readable string (helper method).
+        With a multi-line renderer the layer gets its own line (still
+        feeding the overall reporter) only while its download runs.
 
         Args:
-            size (int): Size in bytes
+            image_name (str): Repository name (e.g., 'library/alpine')
+            layer (dict): Layer descriptor from the image manifest
+            token (str): Bearer token for authentication
+            progress_reporter (ProgressReporter, optional): Overall reporter
+            output_dir (str, optional): Directory to write the blob file into
 
         Returns:
-            str: Formatted size string
+            Result of download_blob
         """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                if unit == "B":
-                    return f"{int(size)} {unit}"
-                else:
-                    return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        digest = layer["digest"]
+        layer_progress = progress_reporter
+        renderer = getattr(progress_reporter, "renderer", None)
+        if renderer is not None:
+            layer_progress = ProgressReporter(
+                layer.get("size") or None,
+                f"Layer {digest.partition(':')[2][:12]}",
+                renderer=renderer,
+                parent=progress_reporter,
+            )
+
+        try:
+            return self.download_blob(
+                image_name,
+                digest,
+                token,
+                progress_reporter=layer_progress,
+                decompress=True,
+                output_dir=output_dir,
+                size=layer.get("size"),
+            )
+        finally:
+            if renderer is not None:
+                renderer.remove(layer_progress)
+
+    # Module-level helper, shared with ProgressReporter
+    _format_bytes = staticmethod(_format_bytes)
 
 
 # =============================================================================
@@ -1496,6 +3086,9 @@ def main():
         # Pull ARM64 image
         %(prog)s ubuntu:latest --arch arm64
         
+        # Pull several architectures (saved as ubuntu_latest_<arch>.tar)
+        %(prog)s ubuntu:latest --arch amd64 --arch arm64
+        
         # With proxy
         %(prog)s nginx:latest --proxy http://proxy.company.com:8080
         
@@ -1513,7 +3106,9 @@ def main():
     )
 
     parser.add_argument(
-        "image", help="Docker image to pull (e.g., ubuntu:20.04, alpine, nginx:latest)"
+        "image",
+        nargs="+",
+        help="Docker image(s) to pull (e.g., ubuntu:20.04, alpine, nginx:latest)",
     )
 
     parser.add_argument(
@@ -1534,8 +3129,9 @@ def main():
     parser.add_argument(
         "--arch",
         "--architecture",
-        help="Target architecture (default: amd64)",
-        default="amd64",
+        help="Target architecture (default: amd64); repeat to pull several",
+        action="append",
+        default=None,
         choices=[
             "amd64",
             "arm64",
@@ -1592,6 +3188,32 @@ def main():
         help="Disable SSL certificate verification (useful for corporate proxies)",
     )
 
+    parser.add_argument(
+        "--max-concurrent-downloads",
+        type=int,
+        default=3,
+        help="Maximum number of layers to download in parallel (default: 3)",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1024 * 1024,
+        help="Read size in bytes for blob downloads (default: 1048576)",
+    )
+
+    parser.add_argument(
+        "--fast-decompress",
+        action="store_true",
+        help="Decompress layers with ISA-L (requires the optional isal package)",
+    )
+
+    parser.add_argument(
+        "--manifest-cache",
+        action="store_true",
+        help="Cache manifests in ~/.cache/dockerpull and revalidate them on later pulls",
+    )
+
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug output for troubleshooting"
     )
@@ -1655,14 +3277,45 @@ def main():
         proxy_config["insecure"] = True
 
     # Create puller instance
-    puller = DockerImagePuller(
-        auth_token=args.token, proxy_config=proxy_config, debug=args.debug
-    )
-
     try:
-        puller.pull_image(
-            args.image, args.output, architecture=args.arch, os_type=args.os
+        puller = DockerImagePuller(
+            auth_token=args.token,
+            proxy_config=proxy_config,
+            debug=args.debug,
+            max_concurrent_downloads=args.max_concurrent_downloads,
+            chunk_size=args.chunk_size,
+            fast_decompress=args.fast_decompress,
+            manifest_cache=args.manifest_cache,
         )
+    except ValueError as e:
+        parser.error(str(e))
+
+    architectures = args.arch or ["amd64"]
+    if args.output and (len(args.image) > 1 or len(architectures) > 1):
+        parser.error("-o/--output can only be used when pulling a single image")
+    if len(args.image) > 1 and len(architectures) > 1:
+        parser.error("several --arch values can only be used with a single image")
+
+    try:
+        if len(architectures) > 1:
+            if puller.pull_images_multiarch(
+                args.image[0], architectures, os_type=args.os
+            ):
+                sys.exit(1)
+        elif len(args.image) == 1:
+            puller.pull_image(
+                args.image[0],
+                args.output,
+                architecture=architectures[0],
+                os_type=args.os,
+            )
+        elif puller.pull_images(
+            args.image, architecture=architectures[0], os_type=args.os
+        ):
+            sys.exit(1)
+    except PullError as e:
+        logger.error(str(e))
+        sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
         sys.exit(1)
@@ -1671,8 +3324,6 @@ def main():
         sys.exit(1)
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 